@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import contextlib
+import io
 import json
+import os
 import re
+import string
 import sys
 import unittest
+from collections import OrderedDict
 from collections.abc import Mapping, Sequence
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import (
     Any,
     Container,
@@ -83,6 +89,7 @@ from vtjson import (
     intersect,
     interval,
     ip_address,
+    is_valid,
     keys,
     lax,
     le,
@@ -107,8 +114,16 @@ from vtjson import (
     validate,
 )
 
+# set VTJSON_TEST_DEBUG to see the error messages produced by the tests
+DEBUG = os.environ.get("VTJSON_TEST_DEBUG", "") != ""
+NETWORK = os.environ.get("VTJSON_TEST_NETWORK", "") != ""
+
+_delete_lower_case = str.maketrans("", "", string.ascii_lowercase)
+
 
 def show(mc: Any) -> None:
+    if not DEBUG:
+        return
     exception = mc.exception
     print(f"{exception.__class__.__name__}: {str(mc.exception)}")
 
@@ -129,6 +144,21 @@ class TestValidation(unittest.TestCase):
             validate(a, object_)
         show(mc)
 
+        # A valid object is checked in a single boolean pass. An invalid one
+        # is walked once more to explain the failure, so in both cases the
+        # work is linear in the depth of the object.
+        object_ = {}
+        for _ in range(10):
+            object_ = {"a": object_}
+        validate(a, object_)
+        object_ = {"b": {}}
+        for _ in range(10):
+            object_ = {"a": object_}
+        with self.assertRaises(ValidationError) as mc:
+            validate(a, object_)
+        show(mc)
+        self.assertTrue("object" + 10 * "['a']" + "['b']" in str(mc.exception))
+
         person: Dict[str, object] = {}
         person["mother"] = union(person, "unknown")
         person["father"] = union(person, "unknown")
@@ -211,6 +241,18 @@ class TestValidation(unittest.TestCase):
             object_ = "hello.doc"
             validate(schema, object_)
         show(mc)
+        for object_ in ["dir/hello.txt", "hello.txt/"]:
+            validate(schema, object_)
+        with self.assertRaises(ValidationError) as mc:
+            object_ = "hello.txt/x"
+            validate(schema, object_)
+        show(mc)
+        schema = glob("dir/*.txt")
+        validate(schema, "dir/hello.txt")
+        with self.assertRaises(ValidationError) as mc:
+            object_ = "hello.txt"
+            validate(schema, object_)
+        show(mc)
         with self.assertRaises(SchemaError) as mc_:
             schema = glob({})  # type: ignore
         show(mc_)
@@ -250,7 +292,8 @@ class TestValidation(unittest.TestCase):
     def test_dict(self) -> None:
         schema: object
         object_: object
-        schema = {regex("[a-z]+"): "lc", regex("[A-Z]+"): "UC"}
+        # the schema is used several times, so it is compiled only once
+        schema = compile({regex("[a-z]+"): "lc", regex("[A-Z]+"): "UC"})
         with self.assertRaises(ValidationError) as mc:
             object_ = []
             validate(schema, object_)
@@ -295,6 +338,35 @@ class TestValidation(unittest.TestCase):
             object_ = {"b": 6}
             validate(schema, object_)
         show(mc)
+        self.assertTrue(" and " in str(mc.exception))
+        schema = {regex("[a-c]"): 4, regex("[b-d]"): 5, regex("(x)\\1"): 6}
+        object_ = {"b": 5, "xx": 6}
+        validate(schema, object_)
+        with self.assertRaises(ValidationError) as mc:
+            object_ = {"e": 4}
+            validate(schema, object_)
+        show(mc)
+        self.assertTrue("object['e'] is not in the schema" in str(mc.exception))
+        validate(schema, object_, strict=False)
+        with self.assertRaises(ValidationError) as mc:
+            object_ = {"xx": 5}
+            validate(schema, object_)
+        show(mc)
+        schema = {regex("[a-c]"): 4, regex("[b-d]"): 5, regex("x|yy"): 6}
+        object_ = {"b": 5, "c": 4, "yy": 6}
+        validate(schema, object_)
+        with self.assertRaises(ValidationError) as mc:
+            object_ = {"d": 4}
+            validate(schema, object_)
+        show(mc)
+        with self.assertRaises(ValidationError) as mc:
+            object_ = {"xyy": 6}
+            validate(schema, object_)
+        show(mc)
+        with self.assertRaises(ValidationError) as mc:
+            object_ = {1: 6}
+            validate(schema, object_)
+        show(mc)
         schema = {"a": 1, regex("a"): 2}
         object_ = {"a": 1}
         validate(schema, object_)
@@ -383,6 +455,12 @@ class TestValidation(unittest.TestCase):
             object_ = 2
             validate(schema, object_)
         show(mc)
+        for divisor in (3, -3):
+            schema = div(divisor, 4)
+            for object_ in (-5, -2, 1, 4, 7):
+                self.assertTrue(is_valid(schema, object_))
+            for object_ in (-1, 0, 2, 3, 5, 6):
+                self.assertFalse(is_valid(schema, object_))
 
     def test_close_to(self) -> None:
         schema: object
@@ -409,63 +487,76 @@ class TestValidation(unittest.TestCase):
 
         schema = close_to(1.0, abs_tol=0.2)
         validate(schema, 1.1)
+        self.assertTrue(is_valid(schema, 1))
+        self.assertFalse(is_valid(schema, 1.3))
+        self.assertFalse(is_valid(schema, "1.0"))
 
         with self.assertRaises(ValidationError) as mc:
             validate(schema, 1.3)
         show(mc)
 
     def test_at_most_one_of(self) -> None:
-        schema: object
-        object_: object
         schema = at_most_one_of("cat", "dog")
-        object_ = {}
-        validate(schema, object_)
-        object_ = {"cat": None}
-        validate(schema, object_)
-        with self.assertRaises(ValidationError) as mc:
-            object_ = {"cat": None, "dog": None}
-            validate(schema, object_)
-        show(mc)
-        with self.assertRaises(ValidationError) as mc:
-            object_ = 1
-            validate(schema, object_)
-        show(mc)
+        object_: object
+        for object_, valid in (
+            ({}, True),
+            ({"cat": None}, True),
+            ({"cat": None, "dog": None}, False),
+            (1, False),
+        ):
+            with self.subTest(object_=object_):
+                if valid:
+                    validate(schema, object_)
+                else:
+                    with self.assertRaises(ValidationError) as mc:
+                        validate(schema, object_)
+                    show(mc)
 
     def test_at_least_one_of(self) -> None:
-        schema: object
-        object_: object
         schema = at_least_one_of("cat", "dog")
-        with self.assertRaises(ValidationError) as mc:
-            object_ = {}
-            validate(schema, object_)
-        show(mc)
-        object_ = {"cat": None}
-        validate(schema, object_)
-        object_ = {"cat": None, "dog": None}
-        validate(schema, object_)
-        with self.assertRaises(ValidationError) as mc:
-            object_ = 1
-            validate(schema, object_)
-        show(mc)
+        object_: object
+        for object_, valid in (
+            ({}, False),
+            ({"cat": None}, True),
+            ({"cat": None, "dog": None}, True),
+            (1, False),
+        ):
+            with self.subTest(object_=object_):
+                if valid:
+                    validate(schema, object_)
+                else:
+                    with self.assertRaises(ValidationError) as mc:
+                        validate(schema, object_)
+                    show(mc)
 
     def test_one_of(self) -> None:
-        schema: object
-        object_: object
         schema = one_of("cat", "dog")
-        with self.assertRaises(ValidationError) as mc:
-            object_ = {}
-            validate(schema, object_)
-        show(mc)
-        object_ = {"cat": None}
-        validate(schema, object_)
-        with self.assertRaises(ValidationError) as mc:
-            object_ = {"cat": None, "dog": None}
-            validate(schema, object_)
-        show(mc)
-        with self.assertRaises(ValidationError) as mc:
-            object_ = 1
-            validate(schema, object_)
-        show(mc)
+        object_: object
+        for object_, valid in (
+            ({}, False),
+            ({"cat": None}, True),
+            ({"cat": None, "dog": None}, False),
+            (OrderedDict({"dog": None, "fish": None}), True),
+            (MappingProxyType({"cat": None, "dog": None}), False),
+            (1, False),
+        ):
+            with self.subTest(object_=object_):
+                if valid:
+                    validate(schema, object_)
+                else:
+                    with self.assertRaises(ValidationError) as mc:
+                        validate(schema, object_)
+                    show(mc)
+
+        # a repeated key is counted twice
+        self.assertFalse(is_valid(one_of("cat", "cat"), {"cat": None}))
+
+        # keys are looked up with `in`, also for a subclass of dict
+        class hidden_cat(Dict[str, object]):
+            def __contains__(self, key: object) -> bool:
+                return key != "cat" and super().__contains__(key)
+
+        validate(schema, hidden_cat({"cat": None, "dog": None}))
 
     def test_keys(self) -> None:
         schema: object
@@ -477,6 +568,19 @@ class TestValidation(unittest.TestCase):
             object_ = {"a": 1}
             validate(schema, object_)
         show(mc)
+        self.assertTrue("object['b'] is missing" in str(mc.exception))
+
+        object_ = OrderedDict({"a": 1, "b": 2, "c": 3})
+        validate(schema, object_)
+
+        # keys are looked up with `in`, also for a subclass of dict
+        class hidden_b(Dict[str, object]):
+            def __contains__(self, key: object) -> bool:
+                return key != "b" and super().__contains__(key)
+
+        with self.assertRaises(ValidationError) as mc:
+            validate(schema, hidden_b({"a": 1, "b": 2}))
+        show(mc)
 
     def test_ifthen(self) -> None:
         schema: object
@@ -529,6 +633,37 @@ class TestValidation(unittest.TestCase):
             validate(schema, "{'a': 1}")
         show(mc)
 
+        with self.assertRaises(SchemaError) as mc_:
+            schema = filter(json.loads, {"a": str}, cache_size=-1)
+        show(mc_)
+        calls = []
+
+        def loads(s: str) -> object:
+            calls.append(s)
+            return json.loads(s)
+
+        schema = compile(filter(loads, {"a": str}, cache_size=16))
+        for _ in range(3):
+            validate(schema, '{"a": "b"}')
+        self.assertEqual(len(calls), 1)
+        with self.assertRaises(ValidationError) as mc:
+            validate(schema, '{"a": 1}')
+        show(mc)
+        self.assertEqual(len(calls), 2)
+        with self.assertRaises(ValidationError) as mc:
+            validate(schema, ["a"])
+        show(mc)
+
+        # equal objects with a different representation do not share a cache
+        # entry
+        for good, bad in ((1.0, (True, 1)), ((1,), ((True,), (1.0,))), (0.0, (-0.0,))):
+            schema = compile(filter(repr, repr(good), cache_size=16))
+            validate(schema, good)
+            for object_ in bad:
+                with self.assertRaises(ValidationError) as mc:
+                    validate(schema, object_)
+                show(mc)
+
         schema = intersect(str, filter(urlparse, fields({"scheme": "http"})))
         object_ = "http://example.org"
         validate(schema, object_, "url")
@@ -537,6 +672,17 @@ class TestValidation(unittest.TestCase):
             validate(schema, object_, "url")
         show(mc)
 
+        # for a plain prefix test a regex is cheaper; it does not invoke the
+        # regular expression engine
+        schema = regex("http://", fullmatch=False)
+        self.assertEqual(schema.prefix, "http://")
+        object_ = "http://example.org"
+        validate(schema, object_, "url")
+        with self.assertRaises(ValidationError) as mc:
+            object_ = "https://example.org"
+            validate(schema, object_, "url")
+        show(mc)
+
     def test_const(self) -> None:
         schema: object
         schema = "a"
@@ -631,25 +777,11 @@ class TestValidation(unittest.TestCase):
         object_ = {"b": 2}
         validate(schema, object_, strict=False)
 
-        schema = {"a?": 1, "b": 2}
-        object_ = {"b": 2, "c": 3}
-        validate(schema, object_, strict=False)
-
-        with self.assertRaises(ValidationError) as mc:
-            object_ = {"a": 1, "c": 3}
-            validate(schema, object_, strict=False)
-        show(mc)
-
-        object_ = {"a": 1, "b": 2}
-        validate(schema, object_, strict=False)
-
-        object_ = {"b": 2}
-        validate(schema, object_, strict=False)
-
         with self.assertRaises(ValidationError) as mc:
             schema = ["a", "b"]
             object_ = ["a"]
             validate(schema, object_, strict=False)
+        show(mc)
 
         object_ = ["a", "b"]
         validate(schema, object_, strict=False)
@@ -681,6 +813,124 @@ class TestValidation(unittest.TestCase):
 
         schema = compile(schema)
         validate(schema, object_)
+        self.assertTrue(compile(schema) is schema)
+        self.assertTrue(compile(url) is compile(url))
+
+        # user defined schema classes may have state, so they are not cached
+        class counter(compiled_schema):
+            def __init__(self) -> None:
+                self.count = 0
+
+            def __validate__(
+                self,
+                obj: object,
+                name: str = "object",
+                strict: bool = True,
+                subs: Mapping[str, object] = {},
+            ) -> str:
+                self.count += 1
+                return ""
+
+        self.assertFalse(compile(counter) is compile(counter))
+
+        # classes that cannot be cached are compiled anyway
+        class unhashable_meta(type):
+            def __eq__(self, other: object) -> bool:
+                return self is other
+
+            __hash__ = None  # type: ignore
+
+        class dummy(metaclass=unhashable_meta):
+            pass
+
+        validate(dummy, dummy())
+        self.assertTrue(isinstance(dummy(), make_type(dummy)))
+        with self.assertRaises(ValidationError) as mc:
+            validate(dummy, 1)
+        show(mc)
+
+        # the first offending key in the order of the object is reported, by
+        # the schema as well as by its compiled version
+        lc_uc = {regex("[a-z]+"): "lc", regex("[A-Z]+"): "UC", "a?": int}
+        for schema, object_, strict_, message in (
+            (
+                {"a": int, "b": str},
+                {"a": 1, "b": 2, "c": 1},
+                True,
+                "object['b'] (value:2) is not of type 'str'",
+            ),
+            (
+                {"a": int, "b": str},
+                {"b": 2, "a": "x"},
+                True,
+                "object['b'] (value:2) is not of type 'str'",
+            ),
+            (
+                {"a": int, "b": str},
+                {"c": 1, "b": 2, "a": 1},
+                True,
+                "object['c'] is not in the schema",
+            ),
+            (
+                {"a": int, "b": str},
+                {"c": 1, "b": 2, "a": 1},
+                False,
+                "object['b'] (value:2) is not of type 'str'",
+            ),
+            (
+                strict({"a": [int, ...]}),
+                {"a": 1, "b": "x"},
+                False,
+                "object['a'] (value:1) is not of type 'list'",
+            ),
+            (lc_uc, {"aa": "lc", "AA": "UC"}, True, ""),
+            (
+                lc_uc,
+                {"aa": "UC"},
+                True,
+                "object['aa'] (value:'UC') is not equal to 'lc'",
+            ),
+            (
+                lc_uc,
+                {"a": "1"},
+                True,
+                "object['a'] (value:'1') is not of type 'int' and "
+                "object['a'] (value:'1') is not equal to 'lc'",
+            ),
+            (lc_uc, {"1": 1, "a": "1"}, True, "object['1'] is not in the schema"),
+            (
+                {regex("[a-z]+"): int, regex("[a-y]+"): str, regex("[a-x]+"): float},
+                {"a": None},
+                True,
+                "object['a'] (value:None) is not of type 'int' and "
+                "object['a'] (value:None) is not of type 'str' and "
+                "object['a'] (value:None) is not of type 'float'",
+            ),
+            (
+                union({"a": int}, {"b": str}),
+                {"a": "x", "b": 1},
+                True,
+                "object['a'] (value:'x') is not of type 'int' and "
+                "object['a'] is not in the schema",
+            ),
+        ):
+            for schema_ in (schema, compile(schema)):
+                with self.subTest(object_=object_, strict=strict_):
+                    if message == "":
+                        validate(schema_, object_, strict=strict_)
+                    else:
+                        with self.assertRaises(ValidationError) as mc:
+                            validate(schema_, object_, strict=strict_)
+                        self.assertEqual(str(mc.exception), message)
+
+        schema = OrderedDict({"a": int})
+        object_ = OrderedDict({"a": 1})
+        validate(schema, object_)
+
+        with self.assertRaises(ValidationError) as mc:
+            object_ = {"a": 1}
+            validate(schema, object_)
+        show(mc)
 
     def test_union(self) -> None:
         schema: object
@@ -694,6 +944,69 @@ class TestValidation(unittest.TestCase):
             validate(schema, object_)
         show(mc)
 
+        with self.assertRaises(ValidationError) as mc:
+            object_ = {"b": 4}
+            validate(schema, object_)
+        show(mc)
+        self.assertTrue(" and " in str(mc.exception))
+
+        schema = union(int, regex("[a-z]+"))
+        self.assertTrue(compile(schema).__is_valid__("ab"))
+        self.assertFalse(compile(schema).__is_valid__("aB"))
+
+        schema = union(2, "a", None, float)
+        for object_ in [2, 2.0, "a", None, 1.5, 1]:
+            validate(schema, object_)
+        for object_ in ["b", [], {}]:
+            with self.assertRaises(ValidationError) as mc:
+                validate(schema, object_)
+            show(mc)
+
+        schema = compile(union(int, str))
+        for object_ in ["a", "b", "c"]:
+            validate(schema, object_)
+        with self.assertRaises(ValidationError) as mc:
+            object_ = None
+            validate(schema, object_)
+        show(mc)
+        message = str(mc.exception)
+        self.assertTrue(message.index("'int'") < message.index("'str'"))
+
+        # wrappers only store their arguments
+        self.assertFalse(hasattr(union(int, str), "__dict__"))
+
+        schema = union({"a": int}, [str, ...], "unknown")
+        for object_ in [{"a": 1}, OrderedDict({"a": 1}), ["x"], [], "unknown"]:
+            validate(schema, object_)
+        for object_ in [{"a": "1"}, ["x", 1], "known", ("x",)]:
+            with self.assertRaises(ValidationError) as mc:
+                validate(schema, object_)
+            show(mc)
+            self.assertEqual(str(mc.exception).count(" and "), 2)
+
+        schema = union(
+            {"kind": "circle", "radius": float},
+            {"kind": "square", "side": float},
+            {"kind": "square", "width": float, "height": float},
+        )
+        for object_ in [
+            {"kind": "circle", "radius": 1.0},
+            {"kind": "square", "side": 2},
+            {"kind": "square", "width": 1, "height": 2},
+        ]:
+            validate(schema, object_)
+        for object_ in [
+            {"kind": "circle", "side": 1.0},
+            {"kind": "square", "radius": 1.0},
+            {"kind": "triangle"},
+            {"kind": ["circle"], "radius": 1.0},
+            {"radius": 1.0},
+        ]:
+            with self.assertRaises(ValidationError) as mc:
+                validate(schema, object_)
+            show(mc)
+            self.assertEqual(str(mc.exception).count(" and "), 2)
+
     def test_set_label(self) -> None:
         schema: object
         object_: object
@@ -715,15 +1028,43 @@ class TestValidation(unittest.TestCase):
         show(mc_)
         schema = {1: set_label("a", "x", debug=True)}
         validate(schema, object_, subs={"x": anything})
-        schema = {1: set_label("a", "x", debug=True)}
-        validate(schema, object_, subs={"x": anything})
         schema = {1: set_label("a", "x", "y", debug=True)}
         validate(schema, object_, subs={"x": anything})
         with self.assertRaises(ValidationError) as mc:
             validate(schema, object_, subs={"x": anything, "y": anything})
         show(mc)
+        self.assertTrue("multiple substitutions for object[1]" in str(mc.exception))
         validate(schema, object_, subs={"x": "b"})
 
+        # an ambiguous substitution is an error even if another alternative
+        # matches
+        subs = {"x": anything, "y": anything}
+        schema_ = union(set_label(int, "x", "y"), str)
+        with self.assertRaises(ValidationError) as mc:
+            validate(schema_, "a", subs=subs)
+        show(mc)
+        with self.assertRaises(ValidationError) as mc:
+            is_valid(schema_, "a", subs=subs)
+        show(mc)
+
+        # the replacement is reported by the boolean check and, with the
+        # name of the object, when explaining a failure
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            validate(schema, object_, subs={"x": "b"})
+        self.assertEqual(
+            stdout.getvalue(), "The schema for an object (key:x) was replaced\n"
+        )
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            with self.assertRaises(ValidationError) as mc:
+                validate(schema, object_, subs={"x": "c"})
+            show(mc)
+        self.assertEqual(stdout.getvalue().count("(key:x) was replaced"), 2)
+        self.assertTrue(
+            "The schema for object[1] (key:x) was replaced" in stdout.getvalue()
+        )
+
     def test_quote(self) -> None:
         schema: object
         object_: object
@@ -812,6 +1153,12 @@ class TestValidation(unittest.TestCase):
             validate(schema, object_)
         show(mc)
 
+        with self.assertRaises(ValidationError) as mc:
+            object_ = 1
+            validate(schema, object_)
+        show(mc)
+        self.assertTrue("'time'" in str(mc.exception))
+
     def test_nothing(self) -> None:
         schema: object
         object_: object
@@ -861,6 +1208,38 @@ class TestValidation(unittest.TestCase):
         with self.assertRaises(ValidationError) as mc:
             validate(schema, object_)
         show(mc)
+        schema = {float}
+        object_ = {1, 2.5}
+        validate(schema, object_)
+        schema = {float, str}
+        object_ = {1, 2.5, "a"}
+        validate(schema, object_)
+        with self.assertRaises(ValidationError) as mc:
+            object_ = {1, 2.5, "a", None}
+            validate(schema, object_)
+        show(mc)
+        schema = {int, "a"}
+        object_ = {1, "a"}
+        validate(schema, object_)
+        with self.assertRaises(ValidationError) as mc:
+            object_ = {1, "b"}
+            validate(schema, object_)
+        show(mc)
+        schema = {regex("[a-z]+")}
+        object_ = {"a", "bc"}
+        validate(schema, object_)
+        object_ = {"a", "bC"}
+        with self.assertRaises(ValidationError) as mc:
+            validate(schema, object_)
+        show(mc)
+        self.assertTrue("'bC'" in str(mc.exception))
+        schema = frozenset({str})
+        object_ = frozenset({"a"})
+        validate(schema, object_)
+        with self.assertRaises(ValidationError) as mc:
+            object_ = {"a"}
+            validate(schema, object_)
+        show(mc)
 
     def test_intersect(self) -> None:
         schema: object
@@ -874,6 +1253,28 @@ class TestValidation(unittest.TestCase):
         object_ = "https://example.com"
         validate(schema, object_)
 
+        schema = intersect(
+            url, regex(r"^https", fullmatch=False), regex(r"[a-z:/.]+"), regex(".*m")
+        )
+        validate(schema, object_)
+        self.assertTrue(compile(schema).__is_valid__(object_))
+
+        with self.assertRaises(ValidationError) as mc:
+            object_ = "https://example.org"
+            validate(schema, object_)
+        show(mc)
+        self.assertTrue("regex('.*m')" in str(mc.exception))
+
+        with self.assertRaises(ValidationError) as mc:
+            object_ = "https://Example.com"
+            validate(schema, object_)
+        show(mc)
+        self.assertTrue("regex('[a-z:/.]+')" in str(mc.exception))
+
+        schema = intersect(regex("(a)b"), regex(r"\w+"))
+        object_ = "ab"
+        validate(schema, object_)
+
         def ordered_pair(o: Any) -> bool:
             ret: bool = o[0] <= o[1]
             return ret
@@ -952,6 +1353,20 @@ class TestValidation(unittest.TestCase):
         object_ = ["a", "b", "c", "d"]
         validate(schema, object_)
 
+        schema = lax({"a?": 1, "b": 2})
+        object_ = {"b": 2, "c": 3}
+        validate(schema, object_)
+
+        with self.assertRaises(ValidationError) as mc:
+            object_ = {"a": 2, "b": 2, "c": 3}
+            validate(schema, object_)
+        show(mc)
+
+        with self.assertRaises(ValidationError) as mc:
+            object_ = {"a": 1, "c": 3}
+            validate(schema, object_)
+        show(mc)
+
     def test_strict_wrapper(self) -> None:
         schema: object
         object_: object
@@ -976,10 +1391,33 @@ class TestValidation(unittest.TestCase):
         self.assertTrue(t.__name__ == "example")
         self.assertTrue(isinstance({"a": 1, "b": 1}, t))
 
+        t = make_type({"a": [int, ...], "b?": regex("[a-z]+")})
+        self.assertTrue(isinstance({"a": [1, 2]}, t))
+        self.assertTrue(isinstance({"a": [], "b": "xyz"}, t))
+        self.assertFalse(isinstance({"a": [1, "2"]}, t))
+        self.assertFalse(isinstance({"a": [1], "b": "XYZ"}, t))
+        self.assertFalse(isinstance({"a": [1], "c": 1}, t))
+        self.assertFalse(isinstance({"b": "xyz"}, t))
+        self.assertFalse(isinstance([], t))
+
+        t = make_type({"a": int, "b": str})
+        self.assertTrue(isinstance({"a": 1, "b": "x"}, t))
+        self.assertFalse(isinstance({"a": 1, "c": "x"}, t))
+        self.assertFalse(isinstance({"a": 1, "b": "x", "c": 1}, t))
+        self.assertFalse(isinstance({"a": 1, "b": 1}, t))
+
+        t = make_type({"a": int, "b": str}, strict=False)
+        self.assertTrue(isinstance({"a": 1, "b": "x", "c": 1}, t))
+
         url_ = make_type(url, debug=True)
         self.assertTrue(url_.__name__ == "url")
         self.assertFalse(isinstance("google.com", url_))
         self.assertTrue(isinstance("https://google.com", url_))
+        # each call makes a new type, but the compiled schema is shared
+        url__ = make_type(url, debug=True)
+        self.assertFalse(url__ is url_)
+        self.assertTrue(isinstance("https://google.com", url__))
+        self.assertTrue(url__.__compiled__ is url_.__compiled__)
 
         country_code = make_type(regex("[A-ZA-Z]", "country_code"), debug=True)
         self.assertTrue(country_code.__name__ == "country_code")
@@ -1012,12 +1450,33 @@ class TestValidation(unittest.TestCase):
             object_ = ["a", 10]
             validate(schema, object_)
         show(mc)
+        self.assertTrue("object[1]" in str(mc.exception))
 
         with self.assertRaises(ValidationError) as mc:
             object_ = ["a", ["b", "c"]]
             validate(schema, object_)
         show(mc)
 
+        schema = [float, ...]
+        object_ = [1.0, 2, 3.5]
+        validate(schema, object_)
+
+        with self.assertRaises(ValidationError) as mc:
+            object_ = [1.0, 2, "3.5"]
+            validate(schema, object_)
+        show(mc)
+        self.assertTrue("object[2]" in str(mc.exception))
+
+        schema = [regex("[a-z]+"), ...]
+        object_ = ["a", "bc"]
+        validate(schema, object_)
+
+        with self.assertRaises(ValidationError) as mc:
+            object_ = ["a", "bc", "dE"]
+            validate(schema, object_)
+        show(mc)
+        self.assertTrue("object[2]" in str(mc.exception))
+
         schema = [...]
         object_ = ["a", "b", 1, 2]
         validate(schema, object_)
@@ -1059,6 +1518,23 @@ class TestValidation(unittest.TestCase):
             schema = [(str, int), ...]
             object_ = [("a", 1), ("b", "c")]
             validate(schema, object_)
+        show(mc)
+
+        with self.assertRaises(ValidationError) as mc:
+            object_ = [("a", 1), ("b",)]
+            validate(schema, object_)
+        show(mc)
+
+        with self.assertRaises(ValidationError) as mc:
+            object_ = [("a", 1), ("b", 2, 3)]
+            validate(schema, object_)
+        show(mc)
+
+        validate(schema, object_, strict=False)
+
+        schema = [(str, float), ...]
+        object_ = [("a", 1), ("b", 2.5)]
+        validate(schema, object_)
 
         schema = [email, ...]
         object_ = ["user1@example.com", "user2@example.com"]
@@ -1084,6 +1560,7 @@ class TestValidation(unittest.TestCase):
             object_ = (1, 2)
             validate(schema, object_)
         show(mc)
+        self.assertTrue("is not of type 'list'" in str(mc.exception))
 
         with self.assertRaises(ValidationError) as mc:
             schema = ["a", "b", None, "c"]
@@ -1103,6 +1580,20 @@ class TestValidation(unittest.TestCase):
             validate(schema, object_)
         show(mc)
 
+        with self.assertRaises(ValidationError) as mc:
+            schema = [int, str, ...]
+            object_ = [1, "a", "b", 2]
+            validate(schema, object_, name="seq")
+        show(mc)
+        self.assertTrue("seq[3]" in str(mc.exception))
+
+        with self.assertRaises(ValidationError) as mc:
+            schema = {"a": [int, {"b": str}]}
+            object_ = {"a": [1, {"b": 2}]}
+            validate(schema, object_)
+        show(mc)
+        self.assertTrue("object['a'][1]['b']" in str(mc.exception))
+
     @unittest.skipUnless(
         vtjson.supports_Generic_ABC,
         "Generic base classes were introduced in Pythin 3.9",
@@ -1302,6 +1793,18 @@ class TestValidation(unittest.TestCase):
         show(mc)
         self.assertTrue("dummy_ex" in str(mc.exception))
 
+        # keys() need not be set-like
+        class dummy_keys(dummy[S, T]):
+            def keys(self) -> List[S]:  # type: ignore[override]
+                return list(self.L)
+
+        schema = dummy({"a": int, "b?": int})
+        validate(schema, dummy_keys({"a": 1}))
+        with self.assertRaises(ValidationError) as mc:
+            validate(schema, dummy_keys({"b": 1}))
+        show(mc)
+        self.assertFalse(is_valid(schema, dummy_keys({"a": 1, "c": 1})))
+
     def test_validate(self) -> None:
         schema: object
         object_: object
@@ -1313,13 +1816,17 @@ class TestValidation(unittest.TestCase):
             ) -> str:
                 if not isinstance(object_, str):
                     return f"{name} (value:{object_}) is not of type str"
-                for c in object_:
-                    if not ("a" <= c <= "z"):
-                        return (
-                            f"{c}, contained in the string {name} "
-                            + f"(value: {repr(object_)}) is not a lower case letter"
-                        )
-                return ""
+                # fast check in C; only look for the culprit on failure
+                if object_ == "" or (
+                    object_.isascii() and object_.isalpha() and object_.islower()
+                ):
+                    return ""
+                # deleting the lower case letters leaves the culprits
+                c = object_.translate(_delete_lower_case)[0]
+                return (
+                    f"{c}, contained in the string {name} "
+                    + f"(value: {repr(object_)}) is not a lower case letter"
+                )
 
         with self.assertRaises(ValidationError) as mc:
             schema = lower_case_string
@@ -1331,11 +1838,13 @@ class TestValidation(unittest.TestCase):
             object_ = "aA"
             validate(schema, object_)
         show(mc)
+        self.assertTrue(str(mc.exception).startswith("A, contained in"))
 
         with self.assertRaises(ValidationError) as mc:
-            object_ = "aA"
+            object_ = "ab\u00e9c"
             validate(schema, object_)
         show(mc)
+        self.assertTrue(str(mc.exception).startswith("\u00e9, contained in"))
 
         object_ = "ab"
         validate(schema, object_)
@@ -1354,18 +1863,88 @@ class TestValidation(unittest.TestCase):
             ) -> str:
                 if not isinstance(object_, str):
                     return f"{name} (value:{object_}) is not of type str"
-                for c in object_:
-                    if not ("a" <= c <= "z"):
-                        return (
-                            f"{c}, contained in the string {name} "
-                            + f"(value: {repr(object_)}) is not a lower case letter"
-                        )
-                return ""
+                # fast check in C; only look for the culprit on failure
+                if object_ == "" or (
+                    object_.isascii() and object_.isalpha() and object_.islower()
+                ):
+                    return ""
+                # deleting the lower case letters leaves the culprits
+                c = object_.translate(_delete_lower_case)[0]
+                return (
+                    f"{c}, contained in the string {name} "
+                    + f"(value: {repr(object_)}) is not a lower case letter"
+                )
+
+            def __is_valid__(
+                self,
+                object_: object,
+                strict: bool = True,
+                subs: Mapping[str, object] = {},
+            ) -> bool:
+                return isinstance(object_, str) and (
+                    object_ == ""
+                    or (object_.isascii() and object_.isalpha() and object_.islower())
+                )
 
         schema = {"a": lower_case_string_ex}
         object_ = {"a": "ab"}
         validate(schema, object_)
 
+        self.assertTrue(lower_case_string_ex().__is_valid__("ab"))
+        self.assertFalse(lower_case_string_ex().__is_valid__("aB"))
+        self.assertFalse(lower_case_string_ex().__is_valid__("a\u00e9"))
+        self.assertFalse(lower_case_string_ex().__is_valid__(1))
+
+        schema = complement(lower_case_string)
+        object_ = "aB"
+        validate(schema, object_)
+
+        with self.assertRaises(ValidationError) as mc:
+            object_ = "ab"
+            validate(schema, object_)
+        show(mc)
+
+    def test_is_valid(self) -> None:
+        schema: object
+        schema = {"a": int, "b?": [str, ...]}
+        self.assertTrue(is_valid(schema, {"a": 1}))
+        self.assertTrue(is_valid(schema, {"a": 1, "b": ["x", "y"]}))
+        self.assertFalse(is_valid(schema, {"a": 1, "b": ["x", 1]}))
+        self.assertFalse(is_valid(schema, {"b": []}))
+        self.assertFalse(is_valid(schema, {"a": 1, "c": 1}))
+        self.assertTrue(is_valid(schema, {"a": 1, "c": 1}, strict=False))
+
+        schema = {"a": set_label(int, "x")}
+        self.assertFalse(is_valid(schema, {"a": "1"}))
+        self.assertTrue(is_valid(schema, {"a": "1"}, subs={"x": str}))
+
+        # the schema is compiled by is_valid() itself
+        for schema in (regex, {"a": regex}):
+            with self.assertRaises(SchemaError) as mc_:
+                is_valid(schema, {"a": "a"})
+            show(mc_)
+
+        # the boolean check agrees with validate()
+        UserId = NewType("UserId", int)
+        object_: object
+        for schema in (
+            lax({"a": int}),
+            strict(lax({"a": int})),
+            set_name([int, ...], "ints"),
+            UserId,
+            quote({1, 2}),
+            [str, int, ...],
+            [union(int, "a"), ...],
+        ):
+            for object_ in ({"a": 1, "b": 2}, [1, 2], ["a", 1, 2], ["a", "b"], {1, 2}):
+                with self.subTest(schema=schema, object_=object_):
+                    try:
+                        validate(schema, object_)
+                        valid = True
+                    except ValidationError:
+                        valid = False
+                    self.assertEqual(is_valid(schema, object_), valid)
+
     def test_regex(self) -> None:
         schema: object
         object_: object
@@ -1381,6 +1960,9 @@ class TestValidation(unittest.TestCase):
             regex("a", name={})  # type: ignore
         show(cm_)
 
+        self.assertTrue(regex("[a-z]+").pattern is regex("[a-z]+", name="x").pattern)
+        self.assertFalse(regex("[a-z]+").pattern is regex("[a-z]+", flags=re.I).pattern)
+
         with self.assertRaises(SchemaError) as cm_:
             schema = regex
             compile(schema)
@@ -1392,54 +1974,60 @@ class TestValidation(unittest.TestCase):
             validate(ip_address, object_)
         show(mc)
 
-        schema = {"ip": ip_address}
-        object_ = {"ip": "123.123.123.123"}
-        validate(schema, object_)
+        # the schema is used for every case, so it is compiled only once
+        schema = compile({"ip": ip_address})
+        for ip, valid in (
+            ("123.123.123.123", True),
+            ("123.123.123", False),
+            ("123.123.123.abc", False),
+            ("123.123..123", False),
+            ("123.123.123.123.123", False),
+            ("123.123.123.1000000", True),
+            ("", False),
+        ):
+            with self.subTest(ip=ip):
+                object_ = {"ip": ip}
+                if valid:
+                    validate(schema, object_)
+                else:
+                    with self.assertRaises(ValidationError) as mc:
+                        validate(schema, object_)
+                    show(mc)
 
         with self.assertRaises(ValidationError) as mc:
-            object_ = {"ip": "123.123.123"}
-            validate(schema, object_)
-        show(mc)
-
-        with self.assertRaises(ValidationError) as mc:
-            object_ = {"ip": "123.123.123.abc"}
+            schema = regex(".")
+            object_ = "\n"
             validate(schema, object_)
         show(mc)
 
-        with self.assertRaises(ValidationError) as mc:
-            object_ = {"ip": "123.123..123"}
-            validate(schema, object_)
-        show(mc)
+        schema = regex(".", flags=re.DOTALL)
+        object_ = "\n"
+        validate(schema, object_)
 
         with self.assertRaises(ValidationError) as mc:
-            object_ = {"ip": "123.123.123.123.123"}
+            schema = regex(".", flags=re.ASCII | re.MULTILINE)
+            object_ = "\n"
             validate(schema, object_)
         show(mc)
 
-        object_ = {"ip": "123.123.123.1000000"}
+        schema = regex(r"^https", fullmatch=False)
+        object_ = "https://example.com"
         validate(schema, object_)
 
         with self.assertRaises(ValidationError) as mc:
-            object_ = {"ip": ""}
+            object_ = "http://example.com"
             validate(schema, object_)
         show(mc)
 
         with self.assertRaises(ValidationError) as mc:
-            schema = regex(".")
-            object_ = "\n"
+            object_ = 1
             validate(schema, object_)
         show(mc)
 
-        schema = regex(".", flags=re.DOTALL)
-        object_ = "\n"
+        schema = regex(r"^http.", fullmatch=False)
+        object_ = "https://example.com"
         validate(schema, object_)
 
-        with self.assertRaises(ValidationError) as mc:
-            schema = regex(".", flags=re.ASCII | re.MULTILINE)
-            object_ = "\n"
-            validate(schema, object_)
-        show(mc)
-
     def test_size(self) -> None:
         schema: object
         object_: object
@@ -1509,97 +2097,25 @@ class TestValidation(unittest.TestCase):
             validate(schema, object_)
         show(mc)
 
-    def test_gt(self) -> None:
-        schema: object
-        object_: object
-        with self.assertRaises(SchemaError) as mc_:
-            schema = gt
-            compile(schema)
-        show(mc_)
-
-        with self.assertRaises(ValidationError) as mc:
-            schema = gt(1)
-            object_ = "a"
-            validate(schema, object_)
-        show(mc)
-
-        with self.assertRaises(ValidationError) as mc:
-            schema = gt(1)
-            object_ = 1
-            validate(schema, object_)
-        show(mc)
-
-        schema = gt(1)
-        object_ = 2
-
-    def test_ge(self) -> None:
-        schema: object
-        object_: object
-        with self.assertRaises(SchemaError) as mc_:
-            schema = ge
-            compile(schema)
-        show(mc_)
-
-        with self.assertRaises(ValidationError) as mc:
-            schema = ge(1)
-            object_ = "a"
-            validate(schema, object_)
-        show(mc)
-
-        with self.assertRaises(ValidationError) as mc:
-            schema = ge(1)
-            object_ = 0
-            validate(schema, object_)
-        show(mc)
-
-        schema = ge(1)
-        object_ = 1
-
-    def test_lt(self) -> None:
-        schema: object
-        object_: object
-        with self.assertRaises(SchemaError) as mc_:
-            schema = lt
-            compile(schema)
-        show(mc_)
-
-        with self.assertRaises(ValidationError) as mc:
-            schema = lt(1)
-            object_ = "a"
-            validate(schema, object_)
-        show(mc)
-
-        with self.assertRaises(ValidationError) as mc:
-            schema = lt(1)
-            object_ = 1
-            validate(schema, object_)
-        show(mc)
-
-        schema = lt(1)
-        object_ = 0
-
-    def test_le(self) -> None:
-        schema: object
-        object_: object
-        with self.assertRaises(SchemaError) as mc_:
-            schema = le
-            compile(schema)
-        show(mc_)
+    def test_ordered_comparisons(self) -> None:
+        for op, bound, bad_value, good_value in (
+            (gt, 1, 1, 2),
+            (ge, 1, 0, 1),
+            (lt, 1, 1, 0),
+            (le, 1, 2, 1),
+        ):
+            with self.subTest(op=op.__name__):
+                with self.assertRaises(SchemaError) as mc_:
+                    compile(op)
+                show(mc_)
 
-        with self.assertRaises(ValidationError) as mc:
-            schema = le(1)
-            object_ = "a"
-            validate(schema, object_)
-        show(mc)
-
-        with self.assertRaises(ValidationError) as mc:
-            schema = le(1)
-            object_ = 2
-            validate(schema, object_)
-        show(mc)
+                schema = op(bound)
+                for object_ in ("a", bad_value):
+                    with self.assertRaises(ValidationError) as mc:
+                        validate(schema, object_)
+                    show(mc)
 
-        schema = le(1)
-        object_ = 1
+                validate(schema, good_value)
 
     def test_interval(self) -> None:
         schema: object
@@ -1648,6 +2164,10 @@ class TestValidation(unittest.TestCase):
         object_ = 5
         validate(schema, object_)
 
+        self.assertTrue(compile(schema).__is_valid__(5))
+        self.assertFalse(compile(schema).__is_valid__(9))
+        self.assertFalse(compile(schema).__is_valid__("a"))
+
         schema = interval(0, ...)
         object_ = 5
         validate(schema, object_)
@@ -1693,6 +2213,12 @@ class TestValidation(unittest.TestCase):
             object_ = "user00@user00.user00"
             validate(schema, object_)
         show(mc)
+        message = str(mc.exception)
+
+        # the second time the outcome comes from the cache
+        with self.assertRaises(ValidationError) as mc:
+            validate(schema, object_)
+        self.assertEqual(str(mc.exception), message)
 
         with self.assertRaises(ValidationError) as mc:
             object_ = 1
@@ -1704,6 +2230,10 @@ class TestValidation(unittest.TestCase):
             validate(schema, object_)
         show(mc)
 
+    @unittest.skipUnless(NETWORK, "set VTJSON_TEST_NETWORK to run tests using DNS")
+    def test_email_deliverability(self) -> None:
+        schema: object
+        object_: object
         with self.assertRaises(ValidationError) as mc:
             schema = email(check_deliverability=True)
             object_ = "user@example.com"
@@ -1745,6 +2275,14 @@ class TestValidation(unittest.TestCase):
             object_ = "123.123.123.123"
             validate(schema, object_)
         show(cm)
+
+        schema = ip_address()
+        validate(schema, object_)
+
+        for object_ in ["123.123.123.256", "01.1.1.1", "1.1.1", "1.1.1.1.1"]:
+            with self.assertRaises(ValidationError) as cm:
+                validate(schema, object_)
+            show(cm)
         object_ = "2001:db8:3333:4444:5555:6666:7777:8888"
         validate(schema, object_)
 
@@ -1793,6 +2331,14 @@ class TestValidation(unittest.TestCase):
             validate(schema, object_)
         show(mc)
 
+        object_ = {"url": "https://google.com/a;b?c=d#e"}
+        validate(schema, object_)
+
+        with self.assertRaises(ValidationError) as mc:
+            object_ = {"url": "http://[::1"}
+            validate(schema, object_)
+        show(mc)
+
     def test_domain_name(self) -> None:
         schema: object
         object_: object
@@ -1818,6 +2364,13 @@ class TestValidation(unittest.TestCase):
             validate(schema, object_)
         show(mc)
 
+        self.assertTrue(domain_name().re_ascii.fullmatch("www.example.com"))
+        self.assertFalse(domain_name().re_ascii.fullmatch("www.éxample.com"))
+
+    @unittest.skipUnless(NETWORK, "set VTJSON_TEST_NETWORK to run tests using DNS")
+    def test_domain_name_resolve(self) -> None:
+        schema: object
+        object_: object
         with self.assertRaises(ValidationError) as mc:
             schema = domain_name(resolve=True)
             object_ = "www.exaaaaaaaaaaaaaaaaaaaaaaaaample.com"
@@ -1882,9 +2435,18 @@ class TestValidation(unittest.TestCase):
         self.assertTrue("TRUNCATED" in valid)
 
         with self.assertRaises(ValidationError) as mc:
-            object__: Dict[int, int] = {}
-            for i in range(1000):
-                object__[i] = 7 * i
+            object_ = tuple(range(1000))
+            validate(schema, object_)
+        show(mc)
+
+        valid = str(mc.exception)
+
+        self.assertTrue(r"value:(0, 1, 2," in valid)
+        self.assertTrue(r"...)" in valid)
+        self.assertTrue("TRUNCATED" in valid)
+
+        with self.assertRaises(ValidationError) as mc:
+            object__: Dict[int, int] = {i: 7 * i for i in range(1000)}
             validate(schema, object__)
         show(mc)
 
@@ -1913,6 +2475,16 @@ class TestValidation(unittest.TestCase):
         show(mc)
         validate(schema, 1.0)
 
+        # plain types are checked with isinstance(), so subclasses match
+        class my_str(str):
+            pass
+
+        for schema, object_ in ((int, True), (float, True), (str, my_str("a"))):
+            self.assertTrue(is_valid(schema, object_))
+            self.assertTrue(is_valid([schema, ...], [object_]))
+            self.assertTrue(is_valid({"a": schema}, {"a": object_}))
+        self.assertFalse(is_valid({"a": str}, {"a": b"a"}))
+
     def test_float_equal(self) -> None:
         schema: object
         object_: object
@@ -1960,18 +2532,28 @@ class TestValidation(unittest.TestCase):
         with self.assertRaises(ValidationError) as mc:
             validate(schema, "c")
         show(mc)
+        self.assertTrue(compile(schema).__is_valid__("b"))
+        self.assertFalse(compile(schema).__is_valid__(["b"]))
 
     @unittest.skipUnless(
         vtjson.supports_Generics,
         "Generics did not work well in Pythin 3.7",
     )
     def test_List(self) -> None:
+        schema: object
         schema = List[str]
         validate(schema, ["a", "b"])
         with self.assertRaises(ValidationError) as mc:
             validate(schema, [1])
         show(mc)
 
+        schema = List[float]
+        validate(schema, [1, 2.5])
+        with self.assertRaises(ValidationError) as mc:
+            validate(schema, [1, 2.5, "3"])
+        show(mc)
+        self.assertTrue("object[2]" in str(mc.exception))
+
     @unittest.skipUnless(
         vtjson.supports_Generics,
         "Generics did not work well in Pythin 3.7",
@@ -2003,6 +2585,9 @@ class TestValidation(unittest.TestCase):
         with self.assertRaises(ValidationError) as mc:
             validate(schema, ("a", "b"))
         show(mc)
+        self.assertTrue("object[1]" in str(mc.exception))
+        self.assertTrue(isinstance(("a", 1), make_type(schema)))
+        self.assertFalse(isinstance(("a", "b"), make_type(schema)))
 
     @unittest.skipUnless(
         sys.version_info >= (3, 9),
@@ -2294,6 +2879,11 @@ class TestValidation(unittest.TestCase):
         show(mc)
         self.assertTrue("dummy" in str(mc.exception))
 
+        # an instance of the NamedTuple itself is still checked field by field
+        with self.assertRaises(ValidationError) as mc:
+            validate(dummy, dummy(b="a"))  # type: ignore[arg-type]
+        show(mc)
+
         class w(NamedTuple):
             b: int = 1
             c: str = ""
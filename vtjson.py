@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import ipaddress
+import itertools
 import math
+import operator
 import pathlib
 import re
 import sys
@@ -138,6 +141,28 @@ class compiled_schema:
 
         return ""
 
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        """
+        Checks if the given object matches the schema without producing an
+        explanation. The default implementation invokes
+        :py:meth:`vtjson.compiled_schema.__validate__`. Subclasses may
+        override it with a cheaper check.
+
+        :param obj: the object to be validated
+        :param strict: indicates whether or not the object being validated is
+          allowed to have keys/entries which are not in the schema
+        :param subs: a dictionary whose keys are labels and whose values are
+          substitution schemas for schemas with those labels
+        :return: `True` if validation succeeds; otherwise `False`
+        """
+
+        return self.__validate__(obj, "object", strict, subs) == ""
+
 
 class wrapper:
     """
@@ -147,6 +172,8 @@ class wrapper:
     be recursive.
     """
 
+    __slots__ = ()
+
     def __compile__(
         self, _deferred_compiles: _mapping | None = None
     ) -> compiled_schema:
@@ -301,16 +328,32 @@ def _get_dns_resolver() -> dns.resolver.Resolver:
     return _dns_resolver
 
 
+@functools.lru_cache(maxsize=4096)
+def _idna_error(domain: str) -> str:
+    # IDNA encoding is expensive and in practice the same domain names tend
+    # to be validated over and over again
+    try:
+        idna.encode(domain, uts46=False)
+    except idna.core.IDNAError as e:
+        return str(e)
+    return ""
+
+
+_TRUNCATION_LIMIT = 120
+
+
 def _c(s: object) -> str:
-    ss = str(s)
-    if len(ss) > 0:
-        c = ss[-1]
-    else:
-        c = ""
-    if len(ss) < 120:
-        ret = ss
+    if type(s) in (list, tuple, dict) and len(cast(Sized, s)) > _TRUNCATION_LIMIT:
+        # Only the head survives truncation so do not stringify the whole thing.
+        if isinstance(s, dict):
+            ret = str(dict(itertools.islice(s.items(), _TRUNCATION_LIMIT)))
+        else:
+            ret = str(cast("Sequence[object]", s)[:_TRUNCATION_LIMIT])
     else:
-        ret = f"{ss[:99]}...[TRUNCATED]..."
+        ret = str(s)
+    if len(ret) >= _TRUNCATION_LIMIT:
+        c = ret[-1]
+        ret = f"{ret[:99]}...[TRUNCATED]..."
         if not isinstance(s, str) and c in r"])}":
             ret += c
     if isinstance(s, str):
@@ -332,16 +375,23 @@ def _canonize_key(key: object) -> object: ...
 
 def _canonize_key(key: object) -> object:
     if isinstance(key, str):
-        if len(key) > 0 and key[-1] == "?":
-            if not (len(key) > 2 and key[-2] == "\\"):
-                return optional_key(key[:-1])
-            else:
-                return optional_key(key[:-2] + "?", _optional=False)
-        else:
-            return optional_key(key, _optional=False)
+        return _canonize_string_key(key)
     return key
 
 
+@functools.lru_cache(maxsize=1024)
+def _canonize_string_key(key: str) -> optional_key[str]:
+    # The same string keys tend to occur in many schemas. Since the
+    # canonized keys are never modified, they can be shared.
+    if len(key) > 0 and key[-1] == "?":
+        if not (len(key) > 2 and key[-2] == "\\"):
+            return optional_key(key[:-1])
+        else:
+            return optional_key(key[:-2] + "?", _optional=False)
+    else:
+        return optional_key(key, _optional=False)
+
+
 def _wrong_type_message(
     obj: object,
     name: str,
@@ -360,15 +410,21 @@ def _wrong_type_message(
 
 class _validate_meta(type):
     __schema__: object
+    __compiled__: compiled_schema | None
     __strict__: bool
     __subs__: Mapping[str, object]
     __dbg__: bool
 
     def __instancecheck__(cls, obj: object) -> bool:
-        valid = _validate(
-            cls.__schema__, obj, "object", strict=cls.__strict__, subs=cls.__subs__
+        # compile on first use and reuse the result for later checks
+        if cls.__compiled__ is None:
+            cls.__compiled__ = compile(cls.__schema__)
+        if not cls.__dbg__:
+            return cls.__compiled__.__is_valid__(obj, cls.__strict__, cls.__subs__)
+        valid = cls.__compiled__.__validate__(
+            obj, "object", cls.__strict__, cls.__subs__
         )
-        if cls.__dbg__ and valid != "":
+        if valid != "":
             print(f"DEBUG: {valid}")
         return valid == ""
 
@@ -381,7 +437,8 @@ def make_type(
     subs: Mapping[str, object] = {},
 ) -> _validate_meta:
     """
-    Transforms a schema into a genuine Python type.
+    Transforms a schema into a genuine Python type. The schema is compiled
+    the first time the type is used in `isinstance()`.
 
     :param schema: the given schema
     :param name: sets the `__name__` attribute of the type; if it is not
@@ -404,6 +461,7 @@ def make_type(
         (),
         {
             "__schema__": schema,
+            "__compiled__": None,
             "__strict__": strict,
             "__dbg__": debug,
             "__subs__": subs,
@@ -411,6 +469,16 @@ def make_type(
     )
 
 
+def _is_hashable(obj: object) -> bool:
+    # a class whose metaclass defines __eq__ but not __hash__ cannot be
+    # looked up in a cache
+    try:
+        hash(obj)
+    except TypeError:
+        return False
+    return True
+
+
 K = TypeVar("K")
 
 
@@ -448,8 +516,21 @@ class optional_key(Generic[K]):
 StringKeyType = TypeVar("StringKeyType", bound=Union[str, optional_key[str]])
 
 
+# the types of the constants in a union that are looked up in a frozenset
+_literal_types = frozenset((str, int, bool, type(None)))
+
+# builtin containers never compare equal to a constant of a literal type
+_container_types = frozenset((dict, list, tuple, set, frozenset))
+
+
 class _union(compiled_schema):
     schemas: list[compiled_schema]
+    validators: tuple[Callable[..., str], ...]
+    order: tuple[compiled_schema, ...]
+    literals: frozenset[object]
+    types: tuple[type, ...]
+    candidates: dict[type, tuple[compiled_schema, ...]]
+    discriminators: dict[type, tuple[object, dict[object, tuple[_dict, ...]]]]
 
     def __init__(
         self,
@@ -459,6 +540,29 @@ class _union(compiled_schema):
         self.schemas = [
             _compile(s, _deferred_compiles=_deferred_compiles) for s in schemas
         ]
+        self.validators = tuple(s.__validate__ for s in self.schemas)
+
+        # Plain types are matched by a single isinstance() check and simple
+        # constants by a lookup in a frozenset. A constant also stays among
+        # the other alternatives since an object may compare equal to it
+        # without having the same hash.
+        literals = set()
+        types_: list[type] = []
+        order = []
+        for s in self.schemas:
+            if type(s) is _type and type(s.schema) is type:
+                types_.append(s.schema)
+                if s.schema is float:
+                    types_.append(int)
+                continue
+            if type(s) is _const and type(s.schema) in _literal_types:
+                literals.add(s.schema)
+            order.append(s)
+        self.literals = frozenset(literals)
+        self.types = tuple(types_)
+        self.order = tuple(order)
+        self.candidates = {}
+        self.discriminators = {}
 
     def __validate__(
         self,
@@ -468,14 +572,108 @@ class _union(compiled_schema):
         subs: Mapping[str, object] = {},
     ) -> str:
         messages = []
-        for schema in self.schemas:
-            message = schema.__validate__(obj, name=name, strict=strict, subs=subs)
+        for validator in self.validators:
+            message = validator(obj, name, strict, subs)
             if message == "":
                 return ""
             else:
                 messages.append(message)
         return " and ".join(messages)
 
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        if len(subs) != 0:
+            # A substitution may raise (if it is ambiguous) so the alternatives
+            # are tried in order, as by __validate__.
+            for schema in self.schemas:
+                if schema.__is_valid__(obj, strict, subs):
+                    return True
+            return False
+        # Only the alternatives that can possibly accept an object of the
+        # given type are tried.
+        if isinstance(obj, self.types):
+            return True
+        type_ = type(obj)
+        if type_ in _literal_types and obj in self.literals:
+            return True
+        candidates = self.candidates.get(type_)
+        if candidates is None:
+            candidates = self.__candidates__(type_)
+        if self.discriminators:
+            discriminator = self.discriminators.get(type_)
+            if discriminator is not None:
+                key, table = discriminator
+                assert isinstance(obj, Mapping)
+                if key not in obj:
+                    return False
+                value = obj[key]
+                if type(value) in _literal_types:
+                    for schema_ in table.get(value, ()):
+                        if schema_.__is_valid__(obj, strict, subs):
+                            return True
+                    return False
+        for schema in candidates:
+            if schema.__is_valid__(obj, strict, subs):
+                return True
+        return False
+
+    def __candidates__(self, type_: type) -> tuple[compiled_schema, ...]:
+        # This is done on first use rather than in the constructor since a
+        # recursive reference is only resolved once compilation has finished.
+        candidates = []
+        for s in self.order:
+            if type(s) is _deferred:
+                s_ = s.target if s.target is not None else s.__resolve__("object")
+            else:
+                s_ = s
+            # these start by checking the type of the object
+            if type(s_) in (_dict, _sequence, _set):
+                assert isinstance(s_, (_dict, _sequence, _set))
+                if not issubclass(type_, s_.type_schema):
+                    continue
+            elif (
+                type(s_) is _const
+                and type(s_.schema) in _literal_types
+                and type_ in _container_types
+            ):
+                continue
+            candidates.append(s)
+        self.candidates[type_] = tuple(candidates)
+        self.__discriminator__(type_)
+        return self.candidates[type_]
+
+    def __discriminator__(self, type_: type) -> None:
+        # If all alternatives are dicts sharing a required key whose value
+        # is a constant, like {"kind": "circle", ...}, then the value of that
+        # key in the object selects the alternatives that need to be tried.
+        dicts = []
+        for s in self.candidates[type_]:
+            if type(s) is _deferred:
+                s = s.target if s.target is not None else s.__resolve__("object")
+            if type(s) is not _dict:
+                return
+            assert isinstance(s, _dict)
+            dicts.append(s)
+        if len(dicts) < 2:
+            return
+        for key, _ in dicts[0].required_items:
+            table: dict[object, tuple[_dict, ...]] = {}
+            for d in dicts:
+                value = d.schema.get(key) if key in d.min_keys else None
+                if type(value) is not _const:
+                    break
+                assert isinstance(value, _const)
+                if type(value.schema) not in _literal_types:
+                    break
+                table[value.schema] = table.get(value.schema, ()) + (d,)
+            else:
+                self.discriminators[type_] = (key, table)
+                return
+
 
 class union(wrapper):
     """
@@ -483,6 +681,8 @@ class union(wrapper):
     one of the schemas `schema1, ..., schemaN`.
     """
 
+    __slots__ = ("schemas",)
+
     schemas: tuple[object, ...]
 
     def __init__(self, *schemas: object) -> None:
@@ -496,7 +696,10 @@ class union(wrapper):
 
 
 class _intersect(compiled_schema):
-    schema: list[compiled_schema]
+    schemas: list[compiled_schema]
+    validators: tuple[Callable[..., str], ...]
+    others: list[compiled_schema]
+    fused: re.Pattern[str] | None
 
     def __init__(
         self,
@@ -506,6 +709,34 @@ class _intersect(compiled_schema):
         self.schemas = [
             _compile(s, _deferred_compiles=_deferred_compiles) for s in schemas
         ]
+        self.validators = tuple(s.__validate__ for s in self.schemas)
+
+        # Several regexes are combined into a single pattern consisting of
+        # lookaheads, so that a string is handed to the regular expression
+        # engine only once. Patterns with groups are excluded since
+        # backreferences would be renumbered, and so are patterns with
+        # (global) flags since these would apply to all patterns.
+        self.fused = None
+        self.others = self.schemas
+        regexes = [
+            s
+            for s in self.schemas
+            if type(s) is regex
+            and s.pattern.groups == 0
+            and s.pattern.flags == re.UNICODE
+        ]
+        if len(regexes) >= 2:
+            lookaheads = "".join(
+                f"(?=(?:{r.regex})\\Z)" if r.fullmatch else f"(?={r.regex})"
+                for r in regexes
+            )
+            try:
+                self.fused = re.compile(lookaheads)
+            except re.error:
+                return
+            self.others = [s for s in self.schemas if s not in regexes]
+            setattr(self, "__validate__", self.__validate_fused__)
+            setattr(self, "__is_valid__", self.__is_valid_fused__)
 
     def __validate__(
         self,
@@ -514,12 +745,54 @@ class _intersect(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
-        for schema in self.schemas:
-            message = schema.__validate__(obj, name=name, strict=strict, subs=subs)
+        for validator in self.validators:
+            message = validator(obj, name, strict, subs)
+            if message != "":
+                return message
+        return ""
+
+    def __validate_fused__(
+        self,
+        obj: object,
+        name: str = "object",
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> str:
+        assert self.fused is not None
+        if not isinstance(obj, str) or self.fused.match(obj) is None:
+            # let the individual schemas explain the failure
+            return _intersect.__validate__(self, obj, name, strict, subs)
+        for schema in self.others:
+            message = schema.__validate__(obj, name, strict, subs)
             if message != "":
                 return message
         return ""
 
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        for schema in self.schemas:
+            if not schema.__is_valid__(obj, strict, subs):
+                return False
+        return True
+
+    def __is_valid_fused__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        assert self.fused is not None
+        if not isinstance(obj, str) or self.fused.match(obj) is None:
+            return False
+        for schema in self.others:
+            if not schema.__is_valid__(obj, strict, subs):
+                return False
+        return True
+
 
 class intersect(wrapper):
     """
@@ -527,6 +800,8 @@ class intersect(wrapper):
     matches all the schemas `schema1, ..., schemaN`.
     """
 
+    __slots__ = ("schemas",)
+
     schemas: tuple[object, ...]
 
     def __init__(self, *schemas: object) -> None:
@@ -554,12 +829,19 @@ class _complement(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
-        message = self.schema.__validate__(obj, name=name, strict=strict, subs=subs)
-        if message != "":
+        if not self.schema.__is_valid__(obj, strict, subs):
             return ""
         else:
             return f"{name} does not match the complemented schema"
 
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        return not self.schema.__is_valid__(obj, strict, subs)
+
 
 class complement(wrapper):
     """
@@ -567,6 +849,8 @@ class complement(wrapper):
     `schema`.
     """
 
+    __slots__ = ("schema",)
+
     schema: object
 
     def __init__(self, schema: object) -> None:
@@ -596,6 +880,14 @@ class _lax(compiled_schema):
     ) -> str:
         return self.schema.__validate__(obj, name=name, strict=False, subs=subs)
 
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        return self.schema.__is_valid__(obj, False, subs)
+
 
 class lax(wrapper):
     """
@@ -603,6 +895,8 @@ class lax(wrapper):
     validated with `strict=False`.
     """
 
+    __slots__ = ("schema",)
+
     schema: object
 
     def __init__(self, schema: object) -> None:
@@ -633,6 +927,14 @@ class _strict(compiled_schema):
     ) -> str:
         return self.schema.__validate__(obj, name=name, strict=True, subs=subs)
 
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        return self.schema.__is_valid__(obj, True, subs)
+
 
 class strict(wrapper):
     """
@@ -640,6 +942,8 @@ class strict(wrapper):
     validated with `strict=True`.
     """
 
+    __slots__ = ("schema",)
+
     def __init__(self, schema: object) -> None:
         """
         :param schema: schema that should be validated against with
@@ -674,14 +978,10 @@ class _set_label(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
-        common_labels = tuple(set(subs.keys()).intersection(self.labels))
-        if len(common_labels) >= 2:
-            raise ValidationError(
-                f"multiple substitutions for {name} "
-                f"(applicable keys:{common_labels})"
-            )
-        elif len(common_labels) == 1:
-            key = common_labels[0]
+        if len(subs) == 0:
+            return self.schema.__validate__(obj, name=name, strict=True, subs=subs)
+        key = self.__substitution__(subs, name)
+        if key is not None:
             if self.debug:
                 print(f"The schema for {name} (key:{key}) was replaced")
             # We have to recompile subs[key]. This seems unavoidable as it is not
@@ -692,6 +992,36 @@ class _set_label(compiled_schema):
         else:
             return self.schema.__validate__(obj, name=name, strict=True, subs=subs)
 
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        if len(subs) == 0:
+            return self.schema.__is_valid__(obj, True, subs)
+        # an ambiguous substitution is an error, also if an alternative of a
+        # union would match
+        key = self.__substitution__(subs, "object")
+        if key is not None:
+            if self.debug:
+                # the name of the object is not known here
+                print(f"The schema for an object (key:{key}) was replaced")
+            return _compile(subs[key]).__is_valid__(obj, True, subs)
+        else:
+            return self.schema.__is_valid__(obj, True, subs)
+
+    def __substitution__(self, subs: Mapping[str, object], name: str) -> str | None:
+        common_labels = tuple(set(subs.keys()).intersection(self.labels))
+        if len(common_labels) >= 2:
+            raise ValidationError(
+                f"multiple substitutions for {name} "
+                f"(applicable keys:{common_labels})"
+            )
+        elif len(common_labels) == 1:
+            return common_labels[0]
+        return None
+
 
 class set_label(wrapper):
     """
@@ -700,6 +1030,8 @@ class set_label(wrapper):
     different one via the `subs` argument to `validate`.
     """
 
+    __slots__ = ("schema", "labels", "debug")
+
     schema: object
     labels: set[str]
     debug: bool
@@ -731,7 +1063,9 @@ class set_label(wrapper):
 class _quote(compiled_schema):
 
     def __init__(self, schema: object) -> None:
-        setattr(self, "__validate__", _const(schema, strict_eq=True).__validate__)
+        c = _const(schema, strict_eq=True)
+        setattr(self, "__validate__", c.__validate__)
+        setattr(self, "__is_valid__", c.__is_valid__)
 
 
 class quote(wrapper):
@@ -741,6 +1075,8 @@ class quote(wrapper):
     matches the object `str`.
     """
 
+    __slots__ = ("schema",)
+
     schema: object
 
     def __init__(self, schema: object) -> None:
@@ -786,6 +1122,14 @@ class _set_name(compiled_schema):
                 )
         return ""
 
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        return self.schema.__is_valid__(obj, strict, subs)
+
 
 class set_name(wrapper):
     """
@@ -793,6 +1137,8 @@ class set_name(wrapper):
     but the `name` argument will be used in non-validation messages.
     """
 
+    __slots__ = ("schema", "name", "reason")
+
     reason: bool
     schema: object
     name: str
@@ -823,6 +1169,13 @@ class set_name(wrapper):
         )
 
 
+@functools.lru_cache(maxsize=256)
+def _re_compile(regex: str, flags: int) -> re.Pattern[str]:
+    # regex schemas are often constructed repeatedly with the same
+    # arguments; let them share the compiled pattern
+    return re.compile(regex, flags)
+
+
 class regex(compiled_schema):
     """
     This matches the strings which match the given pattern.
@@ -832,6 +1185,8 @@ class regex(compiled_schema):
     fullmatch: bool
     __name__: str
     pattern: re.Pattern[str]
+    match: Callable[[str], re.Match[str] | None]
+    prefix: str
 
     def __init__(
         self,
@@ -863,12 +1218,41 @@ class regex(compiled_schema):
             self.__name__ = f"regex({repr(regex)}{_fullmatch}{_flags})"
 
         try:
-            self.pattern = re.compile(regex, flags)
+            self.pattern = _re_compile(regex, flags)
         except Exception as e:
             _name = f" (name: {repr(name)})" if name is not None else ""
             raise SchemaError(
                 f"{regex}{_name} is an invalid regular expression: {str(e)}"
             ) from None
+        self.match = self.pattern.fullmatch if fullmatch else self.pattern.match
+
+        # a pattern like r"^https" is just a literal prefix; there is no
+        # need to invoke the regular expression engine for it
+        if not fullmatch and flags == 0:
+            prefix = regex[1:] if regex.startswith("^") else regex
+            if re.escape(prefix) == prefix:
+                self.prefix = prefix
+                setattr(self, "__validate__", self.__validate_prefix__)
+                setattr(self, "__is_valid__", self.__is_valid_prefix__)
+
+    def __validate_prefix__(
+        self,
+        obj: object,
+        name: str = "object",
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> str:
+        if isinstance(obj, str) and obj.startswith(self.prefix):
+            return ""
+        return _wrong_type_message(obj, name, self.__name__)
+
+    def __is_valid_prefix__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        return isinstance(obj, str) and obj.startswith(self.prefix)
 
     def __validate__(
         self,
@@ -877,17 +1261,19 @@ class regex(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
-        if not isinstance(obj, str):
-            return _wrong_type_message(obj, name, self.__name__)
-        try:
-            if self.fullmatch and self.pattern.fullmatch(obj):
-                return ""
-            elif not self.fullmatch and self.pattern.match(obj):
-                return ""
-        except Exception:
-            pass
+        # a str pattern cannot fail on a str so there is nothing to catch
+        if isinstance(obj, str) and self.match(obj) is not None:
+            return ""
         return _wrong_type_message(obj, name, self.__name__)
 
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        return isinstance(obj, str) and self.match(obj) is not None
+
 
 class glob(compiled_schema):
     """
@@ -896,6 +1282,7 @@ class glob(compiled_schema):
     """
 
     pattern: str
+    suffix: str | None
     __name__: str
 
     def __init__(self, pattern: str, name: str | None = None) -> None:
@@ -923,6 +1310,15 @@ class glob(compiled_schema):
                 f"{repr(pattern)}{_name} is not a valid filename pattern: {str(e)}"
             ) from None
 
+        # A string ending in "txt" certainly matches "*txt". Other strings
+        # are left to pathlib, which e.g. ignores trailing separators and may
+        # be case insensitive.
+        self.suffix = None
+        if pattern.startswith("*") and len(pattern) > 1:
+            suffix = pattern[1:]
+            if not any(c in suffix for c in "*?[]/\\:"):
+                self.suffix = suffix
+
     def __validate__(
         self,
         obj: object,
@@ -930,15 +1326,31 @@ class glob(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
+        if self.__is_valid__(obj, strict, subs):
+            return ""
         if not isinstance(obj, str):
             return _wrong_type_message(obj, name, self.__name__)
+        # match again, only to obtain the explanation
         try:
-            if pathlib.PurePath(obj).match(self.pattern):
-                return ""
-            else:
-                return _wrong_type_message(obj, name, self.__name__)
+            pathlib.PurePath(obj).match(self.pattern)
         except Exception as e:
             return _wrong_type_message(obj, name, self.__name__, str(e))
+        return _wrong_type_message(obj, name, self.__name__)
+
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        if not isinstance(obj, str):
+            return False
+        if self.suffix is not None and obj.endswith(self.suffix):
+            return True
+        try:
+            return pathlib.PurePath(obj).match(self.pattern)
+        except Exception:
+            return False
 
 
 class magic(compiled_schema):
@@ -1001,6 +1413,7 @@ class div(compiled_schema):
 
     divisor: int
     remainder: int
+    residue: int
     __name__: str
 
     def __init__(
@@ -1023,6 +1436,8 @@ class div(compiled_schema):
             raise SchemaError(f"The remainder {repr(remainder)} is not an integer")
         self.divisor = divisor
         self.remainder = remainder
+        # (x - remainder) % divisor == 0 if and only if x % divisor == residue
+        self.residue = remainder % divisor
 
         if name is None:
             _divisor = str(divisor)
@@ -1040,12 +1455,19 @@ class div(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
+        if self.__is_valid__(obj, strict, subs):
+            return ""
         if not isinstance(obj, int):
             return _wrong_type_message(obj, name, "int")
-        elif (obj - self.remainder) % self.divisor == 0:
-            return ""
-        else:
-            return _wrong_type_message(obj, name, self.__name__)
+        return _wrong_type_message(obj, name, self.__name__)
+
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        return isinstance(obj, int) and obj % self.divisor == self.residue
 
 
 class close_to(compiled_schema):
@@ -1056,6 +1478,8 @@ class close_to(compiled_schema):
 
     kw: dict[str, float]
     x: int | float
+    rel_tol: float
+    abs_tol: float
     __name__: str
 
     def __init__(
@@ -1091,6 +1515,10 @@ class close_to(compiled_schema):
         kwl_ = ",".join(kwl)
         self.__name__ = f"close_to({kwl_})"
         self.x = x
+        # the tolerances with the defaults of math.isclose filled in, so that
+        # they need not be unpacked from self.kw on every call
+        self.rel_tol = self.kw.get("rel_tol", 1e-09)
+        self.abs_tol = self.kw.get("abs_tol", 0.0)
 
     def __validate__(
         self,
@@ -1099,12 +1527,21 @@ class close_to(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
+        if self.__is_valid__(obj, strict, subs):
+            return ""
         if not isinstance(obj, (float, int)):
             return _wrong_type_message(obj, name, "number")
-        elif math.isclose(obj, self.x, **self.kw):
-            return ""
-        else:
-            return _wrong_type_message(obj, name, self.__name__)
+        return _wrong_type_message(obj, name, self.__name__)
+
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        return isinstance(obj, (float, int)) and math.isclose(
+            obj, self.x, rel_tol=self.rel_tol, abs_tol=self.abs_tol
+        )
 
 
 class gt(compiled_schema):
@@ -1278,6 +1715,11 @@ class interval(compiled_schema):
 
     lb_s: str
     ub_s: str
+    lb: comparable
+    ub: comparable
+    lb_op: Callable[[Any, Any], Any]
+    ub_op: Callable[[Any, Any], Any]
+    bounds: compiled_schema
 
     def __init__(
         self,
@@ -1323,7 +1765,16 @@ class interval(compiled_schema):
                     f"The upper and lower bound in the interval"
                     f" {ld}{self.lb_s},{self.ub_s}{ud} are incomparable"
                 ) from None
-            setattr(self, "__validate__", _intersect((lower, upper)).__validate__)
+            # the comparison operators are chosen here so that validation
+            # is a single chained test; the operands are in the same order
+            # as in gt, ge, lt and le
+            self.lb = lb
+            self.ub = ub
+            self.lb_op = operator.lt if strict_lb else operator.le
+            self.ub_op = operator.gt if strict_ub else operator.ge
+            self.bounds = _intersect((lower, upper))
+            setattr(self, "__validate__", self.__validate_bounded__)
+            setattr(self, "__is_valid__", self.__is_valid_bounded__)
         elif ub is not ...:
             try:
                 ub <= ub
@@ -1345,6 +1796,28 @@ class interval(compiled_schema):
         else:
             setattr(self, "__validate__", anything().__validate__)
 
+    def __validate_bounded__(
+        self,
+        obj: object,
+        name: str = "object",
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> str:
+        if self.__is_valid_bounded__(obj, strict, subs):
+            return ""
+        return self.bounds.__validate__(obj, name, strict, subs)
+
+    def __is_valid_bounded__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        try:
+            return bool(self.lb_op(self.lb, obj) and self.ub_op(self.ub, obj))
+        except Exception:
+            return False
+
 
 class size(compiled_schema):
     """
@@ -1402,10 +1875,21 @@ class size(compiled_schema):
 class _deferred(compiled_schema):
     collection: _mapping
     key: object
+    target: compiled_schema | None
 
     def __init__(self, collection: _mapping, key: object) -> None:
         self.collection = collection
         self.key = key
+        self.target = None
+
+    def __resolve__(self, name: str) -> compiled_schema:
+        # Validation only starts after compilation has finished. At that
+        # point the schema being referred to is fixed, so it only needs to
+        # be looked up once.
+        if self.key not in self.collection:
+            raise ValidationError(f"{name}: key {self.key} is unknown")
+        self.target = self.collection[self.key]
+        return self.target
 
     def __validate__(
         self,
@@ -1414,11 +1898,21 @@ class _deferred(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
-        if self.key not in self.collection:
-            raise ValidationError(f"{name}: key {self.key} is unknown")
-        return self.collection[self.key].__validate__(
-            obj, name=name, strict=strict, subs=subs
-        )
+        target = self.target
+        if target is None:
+            target = self.__resolve__(name)
+        return target.__validate__(obj, name=name, strict=strict, subs=subs)
+
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        target = self.target
+        if target is None:
+            target = self.__resolve__("object")
+        return target.__is_valid__(obj, strict, subs)
 
 
 class _mapping:
@@ -1483,7 +1977,13 @@ def _compile(
     :raises SchemaError: exception thrown when the schema definition is found
       to contain an error
     """
+    # already compiled schemas are returned as is; this makes validating
+    # against a pre-compiled schema cheap
+    if isinstance(schema, compiled_schema):
+        return schema
     if _deferred_compiles is None:
+        if isinstance(schema, type) and _is_hashable(schema):
+            return _compile_class(schema)
         _deferred_compiles = _mapping()
     # avoid infinite loop in case of a recursive schema
     if schema in _deferred_compiles:
@@ -1493,15 +1993,34 @@ def _compile(
     _deferred_compiles[schema] = _deferred(_deferred_compiles, schema)
 
     # real work starts here
+    ret: compiled_schema
+    # fast path for the most common schema kinds; subclasses (e.g.
+    # OrderedDict) fall through to the general dispatch in _compile_generic
+    if type(schema) is dict:
+        ret = _dict(schema, _deferred_compiles=_deferred_compiles)
+    elif type(schema) is list or type(schema) is tuple:
+        ret = _sequence(schema, _deferred_compiles=_deferred_compiles)
+    elif type(schema) is str or type(schema) is int:
+        ret = _const(schema)
+    else:
+        ret = _compile_generic(schema, _deferred_compiles=_deferred_compiles)
+
+    # back to updating the cache
+    if _deferred_compiles.in_use(schema):
+        _deferred_compiles[schema] = ret
+    else:
+        del _deferred_compiles[schema]
+    return ret
+
+
+def _compile_generic(schema: object, _deferred_compiles: _mapping) -> compiled_schema:
     if supports_Generics:
         origin = typing.get_origin(schema)
     else:
         origin = object()
 
     ret: compiled_schema
-    if isinstance(schema, compiled_schema):
-        ret = schema
-    elif isinstance(schema, type) and issubclass(schema, compiled_schema):
+    if isinstance(schema, type) and issubclass(schema, compiled_schema):
         try:
             ret = schema()
         except Exception:
@@ -1568,12 +2087,27 @@ def _compile(
         ret = _set(schema, _deferred_compiles=_deferred_compiles)
     else:
         ret = _const(schema)
+    return ret
 
-    # back to updating the cache
-    if _deferred_compiles.in_use(schema):
-        _deferred_compiles[schema] = ret
-    else:
-        del _deferred_compiles[schema]
+
+_compiled_classes: dict[type, compiled_schema] = {}
+
+
+def _compile_class(schema: type) -> compiled_schema:
+    # Classes (e.g. a TypedDict or email) are not expected to change after
+    # their definition, and compiling some of them involves introspection.
+    # So the outcome is cached for top level invocations like
+    # validate(email, obj). Only schemas compiled to nodes of this module
+    # are cached. An instance of a user defined subclass of compiled_schema
+    # may carry state, so it is created afresh each time.
+    ret = _compiled_classes.get(schema)
+    if ret is not None:
+        return ret
+    ret = _compile(schema, _deferred_compiles=_mapping())
+    if type(ret).__module__ == __name__:
+        if len(_compiled_classes) >= 256:
+            del _compiled_classes[next(iter(_compiled_classes))]
+        _compiled_classes[schema] = ret
     return ret
 
 
@@ -1584,7 +2118,7 @@ def _validate(
     strict: bool = True,
     subs: Mapping[str, object] = {},
 ) -> str:
-    return compile(schema).__validate__(obj, name=name, strict=strict, subs=subs)
+    return _compile(schema).__validate__(obj, name, strict, subs)
 
 
 def validate(
@@ -1611,23 +2145,57 @@ def validate(
     :raises SchemaError: exception thrown when the schema definition is found
       to contain an error
     """
-    message = _validate(
-        schema,
-        obj,
-        name=name,
-        strict=strict,
-        subs=subs,
-    )
+    compiled = _compile(schema)
+    # An instance of a class that compiles to a plain type check, e.g.
+    # validate(int, 5), is valid without further ado. Classes like a
+    # NamedTuple or a Protocol compile to something else and are checked in
+    # full.
+    if type(obj) is schema and type(compiled) is _type:
+        return
+    # The boolean check does not construct any names or explanations. Only
+    # if it fails, the schema is walked again to find out what went wrong.
+    # An error raised by the boolean check (an ambiguous substitution) is
+    # raised again by __validate__, this time with the name of the object.
+    try:
+        if compiled.__is_valid__(obj, strict, subs):
+            return
+    except ValidationError:
+        pass
+    message = compiled.__validate__(obj, name, strict, subs)
     if message != "":
         raise ValidationError(message)
 
 
-# Some predefined schemas
-
-
-class number(compiled_schema):
-    """
-    A deprecated alias for `float`.
+def is_valid(
+    schema: object,
+    obj: object,
+    strict: bool = True,
+    subs: Mapping[str, object] = {},
+) -> bool:
+    """
+    Checks if the given object validates against the given schema. Unlike
+    :py:func:`vtjson.validate` this does not work out what went wrong. So it
+    is cheaper for objects that are expected to fail validation.
+
+    :param schema: the given schema
+    :param obj: the object to be validated
+    :param strict: indicates whether or not the object being validated is
+      allowed to have keys/entries which are not in the schema
+    :param subs: a dictionary whose keys are labels and whose values are
+      substitution schemas for schemas with those labels
+    :return: `True` if the object validates, `False` otherwise
+    :raises SchemaError: exception thrown when the schema definition is found
+      to contain an error
+    """
+    return _compile(schema).__is_valid__(obj, strict, subs)
+
+
+# Some predefined schemas
+
+
+class number(compiled_schema):
+    """
+    A deprecated alias for `float`.
     """
 
     def __init__(self) -> None:
@@ -1667,6 +2235,15 @@ class float_(compiled_schema):
             return _wrong_type_message(obj, name, "float_")
 
 
+@functools.lru_cache(maxsize=4096)
+def _email_error(obj: str, options: tuple[tuple[str, Any], ...]) -> str:
+    try:
+        email_validator.validate_email(obj, **dict(options))
+        return ""
+    except Exception as e:
+        return str(e)
+
+
 class email(compiled_schema):
     """
     Checks if the object is a valid email address. This uses the package
@@ -1675,6 +2252,8 @@ class email(compiled_schema):
     """
 
     kw: dict[str, Any]
+    options: tuple[tuple[str, Any], ...]
+    cached: bool
 
     def __init__(self, **kw: Any) -> None:
         """
@@ -1686,6 +2265,18 @@ class email(compiled_schema):
             self.kw["dns_resolver"] = _get_dns_resolver()
         if "check_deliverability" not in kw:
             self.kw["check_deliverability"] = False
+        # Without a deliverability check the outcome only depends on the
+        # string and the options, so it may be cached. This cache is shared
+        # between instances since validate(email, ...) creates a new one
+        # each time.
+        self.options = tuple(sorted(self.kw.items()))
+        self.cached = False
+        if not self.kw["check_deliverability"]:
+            try:
+                hash(self.options)
+                self.cached = True
+            except TypeError:
+                pass
 
     def __validate__(
         self,
@@ -1696,11 +2287,54 @@ class email(compiled_schema):
     ) -> str:
         if not isinstance(obj, str):
             return _wrong_type_message(obj, name, "email", f"{_c(obj)} is not a string")
+        if self.cached:
+            explanation = _email_error(obj, self.options)
+        else:
+            explanation = _email_error.__wrapped__(obj, self.options)
+        if explanation != "":
+            return _wrong_type_message(obj, name, "email", explanation)
+        return ""
+
+
+def _is_ipv4_address(obj: str) -> bool:
+    # A quick test with string methods implemented in C. It only accepts
+    # dotted quads that ipaddress.IPv4Address() accepts as well.
+    parts = obj.split(".")
+    if len(parts) != 4:
+        return False
+    for p in parts:
+        if not (0 < len(p) <= 3 and p.isascii() and p.isdigit()):
+            return False
+        if (p[0] == "0" and len(p) > 1) or int(p) > 255:
+            return False
+    return True
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _ip_address_error(method: Callable[[Any], Any], obj: int | str | bytes) -> str:
+    # parsing ip addresses is relatively expensive and in practice the same
+    # addresses tend to be validated over and over again
+    try:
+        method(obj)
+    except ValueError as e:
+        return str(e)
+    return ""
+
+
+def _ip_address(obj: Any) -> object:
+    # ipaddress.ip_address() always tries IPv4 first and only falls back to
+    # IPv6 after an exception; for strings the presence of a colon tells us
+    # which one to use
+    if isinstance(obj, str):
         try:
-            email_validator.validate_email(obj, **self.kw)
-            return ""
-        except Exception as e:
-            return _wrong_type_message(obj, name, "email", str(e))
+            if ":" in obj:
+                return ipaddress.IPv6Address(obj)
+            else:
+                return ipaddress.IPv4Address(obj)
+        except ValueError:
+            pass
+    # this also produces the standard error message
+    return ipaddress.ip_address(obj)
 
 
 class ip_address(compiled_schema):
@@ -1710,6 +2344,7 @@ class ip_address(compiled_schema):
 
     __name__: str
     method: Callable[[Any], Any]
+    ipv4: bool
 
     def __init__(self, version: Literal[4, 6, None] = None) -> None:
         """
@@ -1728,7 +2363,8 @@ class ip_address(compiled_schema):
         elif version == 6:
             self.method = ipaddress.IPv6Address
         else:
-            self.method = ipaddress.ip_address
+            self.method = _ip_address
+        self.ipv4 = version != 6
 
     def __validate__(
         self,
@@ -1739,10 +2375,11 @@ class ip_address(compiled_schema):
     ) -> str:
         if not isinstance(obj, (int, str, bytes)):
             return _wrong_type_message(obj, name, self.__name__)
-        try:
-            self.method(obj)
-        except ValueError as e:
-            return _wrong_type_message(obj, name, self.__name__, explanation=str(e))
+        if self.ipv4 and isinstance(obj, str) and _is_ipv4_address(obj):
+            return ""
+        explanation = _ip_address_error(self.method, obj)
+        if explanation != "":
+            return _wrong_type_message(obj, name, self.__name__, explanation)
         return ""
 
 
@@ -1758,13 +2395,26 @@ class url(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
-        if not isinstance(obj, str):
-            return _wrong_type_message(obj, name, "url")
-        result = urllib.parse.urlparse(obj)
-        if all([result.scheme, result.netloc]):
+        if self.__is_valid__(obj, strict, subs):
             return ""
         return _wrong_type_message(obj, name, "url")
 
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        if not isinstance(obj, str):
+            return False
+        # urlsplit() does not parse the ;params part of the path, which we
+        # do not need
+        try:
+            result = urllib.parse.urlsplit(obj)
+        except ValueError:
+            return False
+        return bool(result.scheme and result.netloc)
+
 
 class date_time(compiled_schema):
     """
@@ -1792,19 +2442,36 @@ class date_time(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
+        if self.__is_valid__(obj, strict, subs):
+            return ""
         if not isinstance(obj, str):
             return _wrong_type_message(obj, name, self.__name__)
+        # parse again, only to obtain the explanation
+        try:
+            self.__parse__(obj)
+        except Exception as e:
+            return _wrong_type_message(obj, name, self.__name__, str(e))
+        return _wrong_type_message(obj, name, self.__name__)
+
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        if not isinstance(obj, str):
+            return False
+        try:
+            self.__parse__(obj)
+        except Exception:
+            return False
+        return True
+
+    def __parse__(self, obj: str) -> None:
         if self.format is not None:
-            try:
-                datetime.datetime.strptime(obj, self.format)
-            except Exception as e:
-                return _wrong_type_message(obj, name, self.__name__, str(e))
+            datetime.datetime.strptime(obj, self.format)
         else:
-            try:
-                datetime.datetime.fromisoformat(obj)
-            except Exception as e:
-                return _wrong_type_message(obj, name, self.__name__, str(e))
-        return ""
+            datetime.datetime.fromisoformat(obj)
 
 
 class date(compiled_schema):
@@ -1819,13 +2486,30 @@ class date(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
+        if self.__is_valid__(obj, strict, subs):
+            return ""
         if not isinstance(obj, str):
             return _wrong_type_message(obj, name, "date")
+        # parse again, only to obtain the explanation
         try:
             datetime.date.fromisoformat(obj)
         except Exception as e:
             return _wrong_type_message(obj, name, "date", str(e))
-        return ""
+        return _wrong_type_message(obj, name, "date")
+
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        if not isinstance(obj, str):
+            return False
+        try:
+            datetime.date.fromisoformat(obj)
+        except Exception:
+            return False
+        return True
 
 
 class time(compiled_schema):
@@ -1840,13 +2524,30 @@ class time(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
+        if self.__is_valid__(obj, strict, subs):
+            return ""
         if not isinstance(obj, str):
-            return _wrong_type_message(obj, name, "date")
+            return _wrong_type_message(obj, name, "time")
+        # parse again, only to obtain the explanation
         try:
             datetime.time.fromisoformat(obj)
         except Exception as e:
             return _wrong_type_message(obj, name, "time", str(e))
-        return ""
+        return _wrong_type_message(obj, name, "time")
+
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        if not isinstance(obj, str):
+            return False
+        try:
+            datetime.time.fromisoformat(obj)
+        except Exception:
+            return False
+        return True
 
 
 class nothing(compiled_schema):
@@ -1878,13 +2579,21 @@ class anything(compiled_schema):
     ) -> str:
         return ""
 
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        return True
+
 
 class domain_name(compiled_schema):
     """
     Checks if the object is a valid domain name.
     """
 
-    re_asci: re.Pattern[str]
+    re_ascii: re.Pattern[str]
     ascii_only: bool
     resolve: bool
     __name__: str
@@ -1894,6 +2603,8 @@ class domain_name(compiled_schema):
         :param ascii_only: if `False` then allow IDNA domain names
         :param resolve: if `True` check if the domain names resolves
         """
+        # no longer used for validation (str.isascii() is faster) but kept
+        # since it is a public attribute
         self.re_ascii = re.compile(r"[\x00-\x7F]*")
         self.ascii_only = ascii_only
         self.resolve = resolve
@@ -1918,14 +2629,13 @@ class domain_name(compiled_schema):
         if not isinstance(obj, str):
             return _wrong_type_message(obj, name, self.__name__)
         if self.ascii_only:
-            if not self.re_ascii.fullmatch(obj):
+            if not obj.isascii():
                 return _wrong_type_message(
                     obj, name, self.__name__, "Non-ascii characters"
                 )
-        try:
-            idna.encode(obj, uts46=False)
-        except idna.core.IDNAError as e:
-            return _wrong_type_message(obj, name, self.__name__, str(e))
+        message = _idna_error(obj)
+        if message != "":
+            return _wrong_type_message(obj, name, self.__name__, message)
 
         if self.resolve:
             try:
@@ -1935,6 +2645,27 @@ class domain_name(compiled_schema):
         return ""
 
 
+def _key_set(args: tuple[object, ...]) -> frozenset[object] | None:
+    # the keys as a set, provided they are hashable and distinct
+    try:
+        key_set = frozenset(args)
+    except TypeError:
+        return None
+    return key_set if len(key_set) == len(args) else None
+
+
+def _count_keys(
+    obj: Mapping[object, object],
+    args: tuple[object, ...],
+    key_set: frozenset[object] | None,
+) -> int:
+    # for a dict the keys are counted in C with a set intersection; other
+    # Mappings may override __contains__
+    if key_set is not None and type(obj) is dict:
+        return len(obj.keys() & key_set)
+    return sum([a in obj for a in args])
+
+
 class at_least_one_of(compiled_schema):
     """
     This represents a dictionary with a least one key among a collection of
@@ -1942,6 +2673,7 @@ class at_least_one_of(compiled_schema):
     """
 
     args: tuple[object, ...]
+    key_set: frozenset[object] | None
     __name__: str
 
     def __init__(self, *args: object) -> None:
@@ -1949,6 +2681,7 @@ class at_least_one_of(compiled_schema):
         :param args: a collection of keys
         """
         self.args = args
+        self.key_set = _key_set(args)
         args_s = [repr(a) for a in args]
         self.__name__ = f"{self.__class__.__name__}({','.join(args_s)})"
 
@@ -1962,7 +2695,7 @@ class at_least_one_of(compiled_schema):
         if not isinstance(obj, Mapping):
             return _wrong_type_message(obj, name, self.__name__)
         try:
-            if any([a in obj for a in self.args]):
+            if _count_keys(obj, self.args, self.key_set) >= 1:
                 return ""
             else:
                 return _wrong_type_message(obj, name, self.__name__)
@@ -1977,6 +2710,7 @@ class at_most_one_of(compiled_schema):
     """
 
     args: tuple[object, ...]
+    key_set: frozenset[object] | None
     __name__: str
 
     def __init__(self, *args: object) -> None:
@@ -1984,6 +2718,7 @@ class at_most_one_of(compiled_schema):
         :param args: a collection of keys
         """
         self.args = args
+        self.key_set = _key_set(args)
         args_s = [repr(a) for a in args]
         self.__name__ = f"{self.__class__.__name__}({','.join(args_s)})"
 
@@ -1997,7 +2732,7 @@ class at_most_one_of(compiled_schema):
         if not isinstance(obj, Mapping):
             return _wrong_type_message(obj, name, self.__name__)
         try:
-            if sum([a in obj for a in self.args]) <= 1:
+            if _count_keys(obj, self.args, self.key_set) <= 1:
                 return ""
             else:
                 return _wrong_type_message(obj, name, self.__name__)
@@ -2012,6 +2747,7 @@ class one_of(compiled_schema):
     """
 
     args: tuple[object, ...]
+    key_set: frozenset[object] | None
     __name__: str
 
     def __init__(self, *args: object) -> None:
@@ -2019,6 +2755,7 @@ class one_of(compiled_schema):
         :param args: a collection of keys
         """
         self.args = args
+        self.key_set = _key_set(args)
         args_s = [repr(a) for a in args]
         self.__name__ = f"{self.__class__.__name__}({','.join(args_s)})"
 
@@ -2032,7 +2769,7 @@ class one_of(compiled_schema):
         if not isinstance(obj, Mapping):
             return _wrong_type_message(obj, name, self.__name__)
         try:
-            if sum([a in obj for a in self.args]) == 1:
+            if _count_keys(obj, self.args, self.key_set) == 1:
                 return ""
             else:
                 return _wrong_type_message(obj, name, self.__name__)
@@ -2047,12 +2784,14 @@ class keys(compiled_schema):
     """
 
     args: tuple[object, ...]
+    key_set: frozenset[object] | None
 
     def __init__(self, *args: object) -> None:
         """
         :param args: a collection of keys
         """
         self.args = args
+        self.key_set = _key_set(args)
 
     def __validate__(
         self,
@@ -2063,6 +2802,14 @@ class keys(compiled_schema):
     ) -> str:
         if not isinstance(obj, Mapping):
             return _wrong_type_message(obj, name, "Mapping")  # TODO: __name__
+        # for a dict the superset test is done in one step in C; only look
+        # for the missing key if it fails
+        if (
+            self.key_set is not None
+            and type(obj) is dict
+            and obj.keys() >= self.key_set
+        ):
+            return ""
         for k in self.args:
             if k not in obj:
                 return f"{name}[{repr(k)}] is missing"
@@ -2097,7 +2844,7 @@ class _ifthen(compiled_schema):
         strict: bool = True,
         subs: Mapping[str, object] = {},
     ) -> str:
-        if self.if_schema.__validate__(obj, name=name, strict=strict, subs=subs) == "":
+        if self.if_schema.__is_valid__(obj, strict, subs):
             return self.then_schema.__validate__(
                 obj, name=name, strict=strict, subs=subs
             )
@@ -2115,6 +2862,8 @@ class ifthen(wrapper):
     match the `else_schema`, if present.
     """
 
+    __slots__ = ("if_schema", "then_schema", "else_schema")
+
     if_schema: object
     then_schema: object
     else_schema: object | None
@@ -2168,7 +2917,7 @@ class _cond(compiled_schema):
         subs: Mapping[str, object] = {},
     ) -> str:
         for c in self.conditions:
-            if c[0].__validate__(obj, name=name, strict=strict, subs=subs) == "":
+            if c[0].__is_valid__(obj, strict, subs):
                 return c[1].__validate__(obj, name=name, strict=strict, subs=subs)
         return ""
 
@@ -2182,6 +2931,8 @@ class cond(wrapper):
     equal to `anything` then this serves as a catch all.
     """
 
+    __slots__ = ("args",)
+
     args: tuple[tuple[object, object], ...]
 
     def __init__(self, *args: tuple[object, object]) -> None:
@@ -2248,6 +2999,8 @@ class fields(wrapper, Generic[StringKeyType]):
     schemaN` respectively.
     """
 
+    __slots__ = ("d",)
+
     d: Mapping[StringKeyType, object]
 
     def __init__(self, d: Mapping[StringKeyType, object]) -> None:
@@ -2271,8 +3024,12 @@ class fields(wrapper, Generic[StringKeyType]):
         return _fields(self.d, _deferred_compiles=_deferred_compiles)
 
 
+_filter_cached_types = frozenset((str, bytes, int, bool, type(None)))
+
+
 class _filter(compiled_schema):
     filter: Callable[[Any], object]
+    cached_filter: Callable[[Any], object] | None
     schema: compiled_schema
     filter_name: str
 
@@ -2281,9 +3038,15 @@ class _filter(compiled_schema):
         filter: Callable[[Any], object],
         schema: object,
         filter_name: str | None = None,
+        cache_size: int | None = None,
         _deferred_compiles: _mapping | None = None,
     ) -> None:
         self.filter = filter
+        self.cached_filter = None
+        if cache_size is not None:
+            self.cached_filter = functools.lru_cache(maxsize=cache_size, typed=True)(
+                filter
+            )
         self.schema = _compile(schema, _deferred_compiles=_deferred_compiles)
         if filter_name is not None:
             self.filter_name = filter_name
@@ -2295,6 +3058,14 @@ class _filter(compiled_schema):
             if self.filter_name == "<lambda>":
                 self.filter_name = "filter"
 
+    def __apply__(self, obj: object) -> object:
+        # The cache is keyed by hash and equality. For these types (but not
+        # e.g. for floats, where 0.0 == -0.0, or for containers, where
+        # (1,) == (True,)) equal objects of the same type are the same value.
+        if self.cached_filter is not None and type(obj) in _filter_cached_types:
+            return self.cached_filter(obj)
+        return self.filter(obj)
+
     def __validate__(
         self,
         obj: object,
@@ -2303,15 +3074,26 @@ class _filter(compiled_schema):
         subs: Mapping[str, object] = {},
     ) -> str:
         try:
-            obj = self.filter(obj)
+            obj = self.__apply__(obj)
         except Exception as e:
             return (
                 f"Applying {self.filter_name} to {name} "
                 f"(value: {_c(obj)}) failed: {str(e)}"
             )
-        name = f"{self.filter_name}({name})"
         return self.schema.__validate__(obj, name="object", strict=strict, subs=subs)
 
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        try:
+            obj = self.__apply__(obj)
+        except Exception:
+            return False
+        return self.schema.__is_valid__(obj, strict, subs)
+
 
 class filter(wrapper):
     """
@@ -2319,21 +3101,32 @@ class filter(wrapper):
     If the callable throws an exception then validation fails.
     """
 
+    __slots__ = ("filter", "schema", "filter_name", "cache_size")
+
     filter: Callable[[Any], object]
     schema: object
     filter_name: str | None
+    cache_size: int | None
 
     def __init__(
         self,
         filter: Callable[[Any], object],
         schema: object,
         filter_name: str | None = None,
+        cache_size: int | None = None,
     ) -> None:
         """
         :param filter: the filter to apply to the object
         :param schema: the schema used for validation once the filter has been
           applied
         :param filter_name: common name to refer to the filter
+        :param cache_size: if given, the results of the filter for this many
+          objects are remembered (see `functools.lru_cache`); this is
+          useful for an expensive filter such as `json.loads` which is applied
+          to the same objects repeatedly; only objects of type `str`, `bytes`,
+          `int`, `bool` and `None` are cached, keyed by their type and value;
+          the cache lives in the compiled schema, so the schema should be
+          compiled once; the filter must be a pure function of its argument
 
         :raises SchemaError: exception thrown when the schema definition is
           found to contain an error
@@ -2342,27 +3135,41 @@ class filter(wrapper):
             raise SchemaError("The filter name is not a string")
         if not callable(filter):
             raise SchemaError("The filter is not callable")
+        if cache_size is not None and (
+            not isinstance(cache_size, int)
+            or isinstance(cache_size, bool)
+            or cache_size < 0
+        ):
+            raise SchemaError("The cache size is not a non-negative integer")
         self.filter = filter
         self.schema = schema
         self.filter_name = filter_name
+        self.cache_size = cache_size
 
     def __compile__(self, _deferred_compiles: _mapping | None = None) -> _filter:
         return _filter(
             self.filter,
             self.schema,
             filter_name=self.filter_name,
+            cache_size=self.cache_size,
             _deferred_compiles=None,
         )
 
 
 class _type(compiled_schema):
     schema: type
+    instance_of: type | tuple[type, ...]
 
     def __init__(self, schema: type, math_numbers: bool = True) -> None:
         if math_numbers:
             if schema == float:
                 setattr(self, "__validate__", self.__validate_float__)
         self.schema = schema
+        # for a class without a metaclass isinstance() cannot be overridden
+        # and cannot fail, so the boolean check is a bare isinstance()
+        if type(schema) is type:
+            self.instance_of = (int, float) if schema is float else schema
+            setattr(self, "__is_valid__", self.__is_valid_plain__)
 
     def __validate__(
         self,
@@ -2394,14 +3201,49 @@ class _type(compiled_schema):
         else:
             return _wrong_type_message(obj, name, "float")
 
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        try:
+            if self.schema == float:
+                return isinstance(obj, (int, float))
+            return isinstance(obj, self.schema)
+        except Exception:
+            return False
+
+    def __is_valid_plain__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        return isinstance(obj, self.instance_of)
+
     def __str__(self) -> str:
         return self.schema.__name__
 
 
+def _plain_type(schema: compiled_schema) -> type | tuple[type, ...] | None:
+    # If the schema is a plain type check, return the second argument for
+    # an equivalent isinstance() call. This allows containers to check their
+    # entries in C.
+    if isinstance(schema, _type) and type(schema.schema) is type:
+        if schema.schema is float:
+            return (int, float)
+        return schema.schema
+    return None
+
+
 class _sequence(compiled_schema):
     type_schema: Type[Sequence[object]]
     schema: list[compiled_schema]
     fill: compiled_schema
+    fill_type: type | tuple[type, ...] | None
+    types: tuple[type | tuple[type, ...], ...] | None
+    is_valids: tuple[Callable[..., bool], ...]
 
     def __init__(
         self,
@@ -2422,7 +3264,29 @@ class _sequence(compiled_schema):
             else:
                 self.fill = _type(object)
                 self.schema = []
-            setattr(self, "__validate__", self.__validate_ellipsis__)
+            if len(self.schema) == 0:
+                # [schema, ...]: for a plain type we can check the entries
+                # directly with isinstance
+                self.fill_type = _plain_type(self.fill)
+                setattr(self, "__validate__", self.__validate_homogeneous__)
+                setattr(self, "__is_valid__", self.__is_valid_homogeneous__)
+            else:
+                setattr(self, "__validate__", self.__validate_ellipsis__)
+                setattr(self, "__is_valid__", self.__is_valid_ellipsis__)
+        else:
+            # a fixed length sequence such as (str, int): if all entries are
+            # plain types the boolean check is a single pass in C
+            types: list[type | tuple[type, ...]] = []
+            for c in self.schema:
+                t = _plain_type(c)
+                if t is None:
+                    self.types = None
+                    break
+                types.append(t)
+            else:
+                self.types = tuple(types)
+            setattr(self, "__is_valid__", self.__is_valid_fixed__)
+        self.is_valids = tuple(s.__is_valid__ for s in self.schema)
 
     def __validate__(
         self,
@@ -2441,12 +3305,28 @@ class _sequence(compiled_schema):
         if ls > lo:
             return f"{name}[{lo}] is missing"
         for i in range(ls):
-            name_ = f"{name}[{i}]"
-            ret = self.schema[i].__validate__(obj[i], name_, strict, subs)
+            ret = self.schema[i].__validate__(obj[i], f"{name}[{i}]", strict, subs)
             if ret != "":
                 return ret
         return ""
 
+    def __is_valid_fixed__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        if not isinstance(obj, self.type_schema):
+            return False
+        ls = len(self.schema)
+        lo = len(obj)
+        if lo < ls or (strict and lo > ls):
+            return False
+        # in lax mode zip() and map() ignore the extra entries
+        if self.types is not None:
+            return all(map(isinstance, obj, self.types))
+        return all(v(o, strict, subs) for v, o in zip(self.is_valids, obj))
+
     def __validate_ellipsis__(
         self,
         obj: object,
@@ -2461,17 +3341,70 @@ class _sequence(compiled_schema):
         if ls > lo:
             return f"{name}[{lo}] is missing"
         for i in range(ls):
-            name_ = f"{name}[{i}]"
-            ret = self.schema[i].__validate__(obj[i], name_, strict, subs)
+            ret = self.schema[i].__validate__(obj[i], f"{name}[{i}]", strict, subs)
             if ret != "":
                 return ret
         for i in range(ls, lo):
-            name_ = f"{name}[{i}]"
-            ret = self.fill.__validate__(obj[i], name_, strict, subs)
+            ret = self.fill.__validate__(obj[i], f"{name}[{i}]", strict, subs)
             if ret != "":
                 return ret
         return ""
 
+    def __is_valid_ellipsis__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        if not isinstance(obj, self.type_schema):
+            return False
+        ls = len(self.schema)
+        if ls > len(obj):
+            return False
+        if not all(v(o, strict, subs) for v, o in zip(self.is_valids, obj)):
+            return False
+        is_valid = self.fill.__is_valid__
+        return all(is_valid(o, strict, subs) for o in itertools.islice(obj, ls, None))
+
+    def __validate_homogeneous__(
+        self,
+        obj: object,
+        name: str = "object",
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> str:
+        if not isinstance(obj, self.type_schema):
+            return _wrong_type_message(obj, name, self.type_schema.__name__)
+        fill_type = self.fill_type
+        if fill_type is not None:
+            # scan the sequence in C; only fall back to a Python loop to
+            # locate the offending entry
+            if all(map(isinstance, obj, itertools.repeat(fill_type))):
+                return ""
+            for i, o in enumerate(obj):
+                if not isinstance(o, fill_type):
+                    return self.fill.__validate__(o, f"{name}[{i}]", strict, subs)
+            return ""
+        for i, o in enumerate(obj):
+            ret = self.fill.__validate__(o, f"{name}[{i}]", strict, subs)
+            if ret != "":
+                return ret
+        return ""
+
+    def __is_valid_homogeneous__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        if not isinstance(obj, self.type_schema):
+            return False
+        fill_type = self.fill_type
+        if fill_type is not None:
+            return all(map(isinstance, obj, itertools.repeat(fill_type)))
+        is_valid = self.fill.__is_valid__
+        return all(is_valid(o, strict, subs) for o in obj)
+
     def __str__(self) -> str:
         return str(self.schema)
 
@@ -2482,7 +3415,9 @@ class _const(compiled_schema):
     def __init__(self, schema: object, strict_eq: bool = False) -> None:
         self.schema = schema
         if isinstance(schema, float) and not strict_eq:
-            setattr(self, "__validate__", close_to(schema).__validate__)
+            c = close_to(schema)
+            setattr(self, "__validate__", c.__validate__)
+            setattr(self, "__is_valid__", c.__is_valid__)
 
     def message(self, name: str, obj: object) -> str:
         return f"{name} (value:{_c(obj)}) is not equal to {repr(self.schema)}"
@@ -2498,6 +3433,16 @@ class _const(compiled_schema):
             return self.message(name, obj)
         return ""
 
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        if obj != self.schema:
+            return False
+        return True
+
     def __str__(self) -> str:
         return str(self.schema)
 
@@ -2532,12 +3477,25 @@ class _callable(compiled_schema):
         return str(self.schema)
 
 
+def _has_keys(obj: Mapping[object, object], keys: frozenset[object]) -> bool:
+    # for a dict the superset test on the keys view is done in C; other
+    # Mappings may override __contains__ or lack a set-like keys()
+    if type(obj) is dict:
+        return obj.keys() >= keys
+    return all(k in obj for k in keys)
+
+
 class _dict(compiled_schema):
-    min_keys: set[object]
-    const_keys: set[object]
-    other_keys: set[compiled_schema]
+    min_keys: frozenset[object]
+    const_keys: frozenset[object]
+    other_keys: list[compiled_schema]
     schema: dict[object, compiled_schema]
+    const_items: tuple[tuple[object, compiled_schema], ...]
+    required_items: tuple[tuple[object, compiled_schema], ...]
+    optional_items: tuple[tuple[object, compiled_schema], ...]
     type_schema: Type[Mapping[object, object]]
+    key_regexes: tuple[regex, ...]
+    key_pattern: re.Pattern[str] | None
 
     def __init__(
         self,
@@ -2545,9 +3503,9 @@ class _dict(compiled_schema):
         _deferred_compiles: _mapping | None = None,
     ) -> None:
         self.type_schema = type(schema)
-        self.min_keys = set()
-        self.const_keys = set()
-        self.other_keys = set()
+        min_keys = set()
+        const_keys = set()
+        self.other_keys = []
         self.schema = {}
         for k in schema:
             compiled_schema = _compile(schema[k], _deferred_compiles=_deferred_compiles)
@@ -2562,12 +3520,54 @@ class _dict(compiled_schema):
             c = _compile(key, _deferred_compiles=_deferred_compiles)
             if isinstance(c, _const):
                 if not optional:
-                    self.min_keys.add(key)
-                self.const_keys.add(key)
+                    min_keys.add(key)
+                const_keys.add(key)
                 self.schema[key] = compiled_schema
             else:
-                self.other_keys.add(c)
+                self.other_keys.append(c)
                 self.schema[c] = compiled_schema
+        self.min_keys = frozenset(min_keys)
+        self.const_keys = frozenset(const_keys)
+        self.const_items = tuple(
+            (k, v) for k, v in self.schema.items() if k in self.const_keys
+        )
+        # for the boolean check the order in which the keys are visited does
+        # not matter, so the required keys can be handled separately
+        self.required_items = tuple(
+            (k, v) for k, v in self.const_items if k in self.min_keys
+        )
+        self.optional_items = tuple(
+            (k, v) for k, v in self.const_items if k not in self.min_keys
+        )
+        # If all other keys are plain regexes then a single alternation of
+        # their patterns tells if a key matches one of them, and which is
+        # the first one. Patterns with groups are left alone since they
+        # would shift the group numbers.
+        self.key_regexes = ()
+        self.key_pattern = None
+        if len(self.other_keys) > 0 and all(
+            type(k) is regex
+            and k.fullmatch
+            and k.pattern.flags == re.UNICODE
+            and k.pattern.groups == 0
+            for k in self.other_keys
+        ):
+            key_regexes = tuple(cast("list[regex]", self.other_keys))
+            try:
+                self.key_pattern = _re_compile(
+                    "|".join(f"({k.regex})" for k in key_regexes), 0
+                )
+                self.key_regexes = key_regexes
+            except re.error:
+                pass
+        # the shape of the schema determines the validation strategy
+        if len(self.other_keys) == 0:
+            setattr(self, "__validate__", self.__validate_const__)
+            if self.min_keys == self.const_keys:
+                # all keys are constant and required
+                setattr(self, "__is_valid__", self.__is_valid_required__)
+            else:
+                setattr(self, "__is_valid__", self.__is_valid_const__)
 
     def __validate__(
         self,
@@ -2579,39 +3579,125 @@ class _dict(compiled_schema):
         if not isinstance(obj, self.type_schema):
             return _wrong_type_message(obj, name, self.type_schema.__name__)
 
-        for k in self.min_keys:
-            if k not in obj:
-                name_ = f"{name}[{repr(k)}]"
-                return f"{name_} is missing"
+        # only look for the offending key if the quick test fails
+        if not _has_keys(obj, self.min_keys):
+            for k in self.min_keys:
+                if k not in obj:
+                    name_ = f"{name}[{repr(k)}]"
+                    return f"{name_} is missing"
 
         for k in obj:
-            vals = []
-            name_ = f"{name}[{repr(k)}]"
+            vals = None
             if k in self.const_keys:
                 val = self.schema[k].__validate__(
-                    obj[k], name=name_, strict=strict, subs=subs
+                    obj[k], name=f"{name}[{repr(k)}]", strict=strict, subs=subs
                 )
                 if val == "":
                     continue
-                else:
-                    vals.append(val)
+                vals = [val]
+
+            key_pattern = self.key_pattern
+            if key_pattern is not None:
+                m = key_pattern.fullmatch(k) if isinstance(k, str) else None
+                if m is None:
+                    # the key does not match any of the regexes
+                    if vals is not None:
+                        return " and ".join(vals)
+                    elif strict:
+                        return f"{name}[{repr(k)}] is not in the schema"
+                    continue
 
             for kk in self.other_keys:
-                if kk.__validate__(k, name="key", strict=strict, subs=subs) == "":
+                if kk.__is_valid__(k, strict, subs):
                     val = self.schema[kk].__validate__(
-                        obj[k], name=name_, strict=strict, subs=subs
+                        obj[k], name=f"{name}[{repr(k)}]", strict=strict, subs=subs
                     )
                     if val == "":
                         break
-                    else:
-                        vals.append(val)
+                    if vals is None:
+                        vals = []
+                    vals.append(val)
             else:
-                if len(vals) > 0:
+                if vals is not None:
                     return " and ".join(vals)
                 elif strict:
-                    return f"{name_} is not in the schema"
+                    return f"{name}[{repr(k)}] is not in the schema"
+        return ""
+
+    def __validate_const__(
+        self,
+        obj: object,
+        name: str = "object",
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> str:
+        if not isinstance(obj, self.type_schema):
+            return _wrong_type_message(obj, name, self.type_schema.__name__)
+
+        if not _has_keys(obj, self.min_keys):
+            for k in self.min_keys:
+                if k not in obj:
+                    name_ = f"{name}[{repr(k)}]"
+                    return f"{name_} is missing"
+
+        # The first offending key in the order of the object is reported. In
+        # lax mode keys which are not in the schema are ignored.
+        for k in obj:
+            if k not in self.const_keys:
+                if strict:
+                    return f"{name}[{repr(k)}] is not in the schema"
+                continue
+            val = self.schema[k].__validate__(
+                obj[k], f"{name}[{repr(k)}]", strict, subs
+            )
+            if val != "":
+                return val
         return ""
 
+    def __is_valid_const__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        # a straight sequence of key and value checks; no names are built
+        if not isinstance(obj, self.type_schema):
+            return False
+        if not _has_keys(obj, self.min_keys):
+            return False
+        if strict:
+            if type(obj) is dict:
+                if not obj.keys() <= self.const_keys:
+                    return False
+            elif not all(k in self.const_keys for k in obj):
+                return False
+        for k, v in self.required_items:
+            if not v.__is_valid__(obj[k], strict, subs):
+                return False
+        for k, v in self.optional_items:
+            if k in obj and not v.__is_valid__(obj[k], strict, subs):
+                return False
+        return True
+
+    def __is_valid_required__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        if not isinstance(obj, self.type_schema):
+            return False
+        # once all keys are known to be present, an object without extra
+        # keys is one of the right size
+        if not _has_keys(obj, self.min_keys):
+            return False
+        if strict and len(obj) != len(self.required_items):
+            return False
+        for k, v in self.required_items:
+            if not v.__is_valid__(obj[k], strict, subs):
+                return False
+        return True
+
     def __str__(self) -> str:
         return str(self.schema)
 
@@ -2620,6 +3706,7 @@ class _set(compiled_schema):
     type_schema: Type[Set[object]]
     schema: compiled_schema
     schema_: Set[object]
+    item_type: type | tuple[type, ...] | None
 
     def __init__(
         self,
@@ -2628,15 +3715,23 @@ class _set(compiled_schema):
     ) -> None:
         self.type_schema = type(schema)
         self.schema_ = schema
+        self.item_type = None
         if len(schema) == 0:
             setattr(self, "__validate__", self.__validate_empty_set__)
+            setattr(self, "__is_valid__", self.__is_valid_empty_set__)
         elif len(schema) == 1:
             self.schema = _compile(
                 tuple(schema)[0], _deferred_compiles=_deferred_compiles
             )
-            setattr(self, "__validate__", self.__validate_singleton__)
+            # for a plain type we can check the entries directly with isinstance
+            self.item_type = _plain_type(self.schema)
         else:
-            self.schema = _union(tuple(schema), _deferred_compiles=_deferred_compiles)
+            union_ = _union(tuple(schema), _deferred_compiles=_deferred_compiles)
+            self.schema = union_
+            # if all alternatives are plain types, e.g. {int, str}, then
+            # isinstance can check the entries against all of them at once
+            if len(union_.order) == 0:
+                self.item_type = union_.types
 
     def __validate_empty_set__(
         self,
@@ -2651,21 +3746,13 @@ class _set(compiled_schema):
             return f"{name} (value:{_c(obj)}) is not empty"
         return ""
 
-    def __validate_singleton__(
+    def __is_valid_empty_set__(
         self,
         obj: object,
-        name: str = "object",
         strict: bool = True,
         subs: Mapping[str, object] = {},
-    ) -> str:
-        if not isinstance(obj, set):
-            return _wrong_type_message(obj, name, self.type_schema.__name__)
-        for i, o in enumerate(obj):
-            name_ = f"{name}{{{i}}}"
-            v = self.schema.__validate__(o, name=name_, strict=True, subs=subs)
-            if v != "":
-                return v
-        return ""
+    ) -> bool:
+        return isinstance(obj, self.type_schema) and len(obj) == 0
 
     def __validate__(
         self,
@@ -2683,6 +3770,20 @@ class _set(compiled_schema):
                 return v
         return ""
 
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        if not isinstance(obj, self.type_schema):
+            return False
+        item_type = self.item_type
+        if item_type is not None:
+            return all(map(isinstance, obj, itertools.repeat(item_type)))
+        is_valid = self.schema.__is_valid__
+        return all(is_valid(o, True, subs) for o in obj)
+
     def __str__(self) -> str:
         return str(self.schema_)
 
@@ -2736,6 +3837,8 @@ class protocol(wrapper):
     which validate the corresponding fields in the object.
     """
 
+    __slots__ = ("schema", "dict")
+
     schema: object
     dict: bool
 
@@ -2767,33 +3870,27 @@ class _Literal(compiled_schema):
     def __init__(
         self, schema: tuple[object, ...], _deferred_compiles: _mapping | None = None
     ) -> None:
-        setattr(
-            self,
-            "__validate__",
-            _union(schema, _deferred_compiles=_deferred_compiles).__validate__,
-        )
+        u = _union(schema, _deferred_compiles=_deferred_compiles)
+        setattr(self, "__validate__", u.__validate__)
+        setattr(self, "__is_valid__", u.__is_valid__)
 
 
 class _Union(compiled_schema):
     def __init__(
         self, schema: tuple[object, ...], _deferred_compiles: _mapping | None = None
     ) -> None:
-        setattr(
-            self,
-            "__validate__",
-            _union(schema, _deferred_compiles=_deferred_compiles).__validate__,
-        )
+        u = _union(schema, _deferred_compiles=_deferred_compiles)
+        setattr(self, "__validate__", u.__validate__)
+        setattr(self, "__is_valid__", u.__is_valid__)
 
 
 class _Tuple(compiled_schema):
     def __init__(
         self, schema: tuple[object, ...], _deferred_compiles: _mapping | None = None
     ) -> None:
-        setattr(
-            self,
-            "__validate__",
-            _sequence(schema, _deferred_compiles=_deferred_compiles).__validate__,
-        )
+        sequence = _sequence(schema, _deferred_compiles=_deferred_compiles)
+        setattr(self, "__validate__", sequence.__validate__)
+        setattr(self, "__is_valid__", sequence.__is_valid__)
 
 
 class _Mapping(compiled_schema):
@@ -2828,11 +3925,11 @@ class _Mapping(compiled_schema):
             return _wrong_type_message(obj, name, self.__name__)
 
         for k, v in obj.items():
-            _name = f"{name}[{repr(k)}]"
-            message = self.key.__validate__(k, name=str(k), strict=strict, subs=subs)
-            if message != "":
-                return f"{_name} is not in the schema"
-            message = self.value.__validate__(v, name=_name, strict=strict, subs=subs)
+            if not self.key.__is_valid__(k, strict, subs):
+                return f"{name}[{repr(k)}] is not in the schema"
+            message = self.value.__validate__(
+                v, name=f"{name}[{repr(k)}]", strict=strict, subs=subs
+            )
             if message != "":
                 return message
 
@@ -2842,6 +3939,7 @@ class _Mapping(compiled_schema):
 class _Container(compiled_schema):
     type_schema: Type[Mapping[object, object]]
     schema: compiled_schema
+    item_type: type | tuple[type, ...] | None
     __name__: str
 
     def __init__(
@@ -2855,6 +3953,8 @@ class _Container(compiled_schema):
         self.schema = _compile(schema[0], _deferred_compiles=_deferred_compiles)
         self.type_schema = type_schema
         self.__name__ = _generic_name(type_schema, schema)
+        # for a plain type we can check the entries directly with isinstance
+        self.item_type = _plain_type(self.schema)
 
     def __validate__(
         self,
@@ -2880,6 +3980,25 @@ class _Container(compiled_schema):
 
         return ""
 
+    def __is_valid__(
+        self,
+        obj: object,
+        strict: bool = True,
+        subs: Mapping[str, object] = {},
+    ) -> bool:
+        if not isinstance(obj, self.type_schema):
+            return False
+        try:
+            if self.item_type is not None:
+                return all(map(isinstance, obj, itertools.repeat(self.item_type)))
+            is_valid = self.schema.__is_valid__
+            for o in obj:
+                if not is_valid(o, strict, subs):
+                    return False
+        except Exception:
+            return False
+        return True
+
 
 class _NewType(compiled_schema):
     def __init__(
@@ -2889,11 +4008,8 @@ class _NewType(compiled_schema):
         c = _set_name(
             schema.__supertype__, schema.__name__, _deferred_compiles=_deferred_compiles
         )
-        setattr(
-            self,
-            "__validate__",
-            c.__validate__,
-        )
+        setattr(self, "__validate__", c.__validate__)
+        setattr(self, "__is_valid__", c.__is_valid__)
 
 
 class _Annotated(compiled_schema):
@@ -2914,8 +4030,5 @@ class _Annotated(compiled_schema):
             c = _compile(collect_[0], _deferred_compiles=_deferred_compiles)
         else:
             c = _intersect(collect_, _deferred_compiles=_deferred_compiles)
-        setattr(
-            self,
-            "__validate__",
-            c.__validate__,
-        )
+        setattr(self, "__validate__", c.__validate__)
+        setattr(self, "__is_valid__", c.__is_valid__)